@@ -1,6 +1,22 @@
+import atexit
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
-from accreditation.firebase_utils import create_document
+from accreditation.firebase_utils import firestore_helper
+
+# Audit events are queued in memory and flushed by a background thread so
+# write endpoints do not spend a Firestore round-trip on logging before
+# responding. Events are batched up to the Firestore batch-write limit or
+# one flush interval, whichever fills first.
+_AUDIT_FLUSH_INTERVAL = 1.0
+_AUDIT_BATCH_LIMIT = 500  # Firestore caps batched writes at 500 ops
+_AUDIT_QUEUE_MAX = 10000  # bound the backlog so a Firestore outage can't grow it forever
+
+_audit_queue = queue.Queue(maxsize=_AUDIT_QUEUE_MAX)
+_audit_worker_lock = threading.Lock()
+_audit_worker_started = False
 
 
 def _now_iso():
@@ -11,18 +27,91 @@ def get_client_ip(request) -> str:
     """
     Get the client's IP address from the request.
     Handles proxies and load balancers correctly.
+
+    The parsed value is memoized on the request, so views that audit both
+    success and failure paths only parse the headers once.
     """
+    cached = getattr(request, '_client_ip', None)
+    if cached is not None:
+        return cached
+
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
         ip = x_forwarded_for.split(',')[0].strip()
     else:
         ip = request.META.get('REMOTE_ADDR', '')
+
+    request._client_ip = ip
     return ip
 
 
+def _flush_events(events):
+    """Write a list of audit events to Firestore in one batched commit"""
+    try:
+        if not firestore_helper.is_connected():
+            raise Exception("Firestore not connected")
+
+        batch = firestore_helper.db.batch()
+        collection = firestore_helper.db.collection('audit_trail')
+        for event in events:
+            batch.set(collection.document(), event)
+        batch.commit()
+    except Exception as e:
+        # Swallow exceptions to avoid impacting main flow; log to console for debugging
+        try:
+            print(f"Error writing audit batch: {e}")
+        except Exception:
+            pass
+
+
+def _audit_worker():
+    """Drain the audit queue forever, batching events per flush interval"""
+    while True:
+        events = [_audit_queue.get()]
+        deadline = time.monotonic() + _AUDIT_FLUSH_INTERVAL
+        while len(events) < _AUDIT_BATCH_LIMIT:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                events.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush_events(events)
+
+
+def _ensure_audit_worker():
+    """Start the background flusher once, on first use"""
+    global _audit_worker_started
+    if _audit_worker_started:
+        return
+    with _audit_worker_lock:
+        if not _audit_worker_started:
+            threading.Thread(target=_audit_worker, daemon=True).start()
+            _audit_worker_started = True
+
+
+def _flush_remaining():
+    """Flush whatever is still queued when the process exits"""
+    events = []
+    while True:
+        try:
+            events.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    if events:
+        _flush_events(events)
+
+
+atexit.register(_flush_remaining)
+
+
 def log_audit(user: Optional[Dict[str, Any]], action_type: str, resource_type: str, resource_id: Optional[str] = None, details: Optional[str] = None, status: str = 'success', ip: Optional[str] = None) -> None:
     """
-    Write an audit record to Firestore collection 'audit_trail'.
+    Queue an audit record for the Firestore collection 'audit_trail'.
+
+    The record is written by a background thread in batched commits, so
+    callers never block on the audit round-trip.
 
     user: a dict with at least 'id' and 'email' or None
     action_type: 'login', 'logout', 'document_upload', 'report_generation', 'report_download', 'create', 'update', 'delete'
@@ -54,8 +143,13 @@ def log_audit(user: Optional[Dict[str, Any]], action_type: str, resource_type: s
             'ip': ip,
         }
 
-        # Use create_document helper to persist
-        create_document('audit_trail', audit)
+        _ensure_audit_worker()
+        try:
+            _audit_queue.put_nowait(audit)
+        except queue.Full:
+            # Backlog cap reached (e.g. Firestore outage): write this event
+            # synchronously rather than dropping it or blocking forever
+            _flush_events([audit])
     except Exception as e:
         # Swallow exceptions to avoid impacting main flow; log to console for debugging
         try:
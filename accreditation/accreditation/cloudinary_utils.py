@@ -2,8 +2,53 @@
 Cloudinary utility functions for file uploads
 """
 import os
-import re
+import threading
+import time
+from functools import wraps
 
+# Cap concurrent Cloudinary requests per process: uploads, deletes and
+# report publishes from different requests all share one account-level
+# rate limit
+_cloudinary_semaphore = threading.BoundedSemaphore(10)
+
+
+def _is_rate_limited(exc):
+    """True when exc is Cloudinary's RateLimited error (import kept lazy)"""
+    try:
+        from cloudinary.exceptions import RateLimited
+    except ImportError:
+        return False
+    return isinstance(exc, RateLimited)
+
+
+def retry_on_rate_limit(max_retries=3, initial_delay=1):
+    """
+    Decorator to retry Cloudinary operations when the API rate-limits
+    Uses exponential backoff, mirroring firebase_utils.retry_on_quota_exceeded
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            delay = initial_delay
+            for attempt in range(max_retries):
+                try:
+                    with _cloudinary_semaphore:
+                        return func(*args, **kwargs)
+                except Exception as e:
+                    if not _is_rate_limited(e) or attempt >= max_retries - 1:
+                        raise
+                    print(f"Cloudinary rate limited, retrying in {delay}s (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(delay)
+                    delay = min(delay * 2, 30)  # Exponential backoff
+                    # Rewind file-like payloads partially read by the
+                    # failed attempt before retrying the upload
+                    if args and hasattr(args[0], 'seek'):
+                        args[0].seek(0)
+        return wrapper
+    return decorator
+
+
+@retry_on_rate_limit()
 def upload_image_to_cloudinary(file, folder='uploads'):
     """
     Upload an image file to Cloudinary
@@ -61,6 +106,7 @@ def upload_image_to_cloudinary(file, folder='uploads'):
         raise e
 
 
+@retry_on_rate_limit()
 def delete_image_from_cloudinary(image_url):
     """
     Delete an image from Cloudinary using its URL
@@ -163,6 +209,57 @@ def extract_public_id_from_url(url):
         return None
 
 
+@retry_on_rate_limit()
+def delete_images_from_cloudinary_bulk(image_urls):
+    """
+    Delete multiple images from Cloudinary in batched API calls
+
+    Args:
+        image_urls: List of full Cloudinary URLs
+
+    Returns:
+        int: Number of public IDs submitted for deletion
+    """
+    try:
+        import cloudinary
+        import cloudinary.api
+
+        # Get credentials from environment variables
+        api_key = os.environ.get('CLOUDINARY_API_KEY', '')
+        api_secret = os.environ.get('CLOUDINARY_API_SECRET', '')
+
+        # Check if credentials are available
+        if not api_key or not api_secret:
+            print("Cloudinary credentials not found. Skipping deletion.")
+            return 0
+
+        # Configure Cloudinary
+        cloudinary.config(
+            cloud_name='dygrh6ztt',
+            api_key=api_key,
+            api_secret=api_secret,
+            secure=True
+        )
+
+        public_ids = [pid for pid in (extract_public_id_from_url(url) for url in image_urls) if pid]
+        if not public_ids:
+            return 0
+
+        # The Admin API accepts at most 100 public IDs per call
+        for start in range(0, len(public_ids), 100):
+            cloudinary.api.delete_resources(public_ids[start:start + 100], resource_type='image')
+
+        return len(public_ids)
+
+    except ImportError:
+        print("Warning: cloudinary package not installed.")
+        return 0
+    except Exception as e:
+        print(f"Error bulk deleting images from Cloudinary: {str(e)}")
+        return 0
+
+
+@retry_on_rate_limit()
 def upload_document_to_cloudinary(file, folder='documents', filename=None):
     """
     Upload a document file (doc, docx, pdf, ppt, etc.) to Cloudinary
@@ -251,6 +348,7 @@ def upload_document_to_cloudinary(file, folder='documents', filename=None):
         raise e
 
 
+@retry_on_rate_limit()
 def delete_document_from_cloudinary(document_url):
     """
     Delete a document from Cloudinary using its URL
@@ -315,12 +413,13 @@ def delete_document_from_cloudinary(document_url):
         return False
 
 
+@retry_on_rate_limit()
 def upload_file_to_cloudinary(file_data, filename, folder='uploads'):
     """
     Upload any file (PDF, Excel, etc.) to Cloudinary
     
     Args:
-        file_data: File bytes data
+        file_data: File bytes data or a file-like object (e.g. BytesIO)
         filename: Name of the file
         folder: Cloudinary folder name
         
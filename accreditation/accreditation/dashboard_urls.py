@@ -33,6 +33,7 @@ urlpatterns = [
     path('performance/', dashboard_views.performance_view, name='performance'),
     path('reports/', dashboard_views.reports_view, name='reports'),
     path('reports/generate/', dashboard_views.generate_report, name='generate_report'),
+    path('reports/status/<str:report_id>/', dashboard_views.report_status, name='report_status'),
     path('reports/delete/<str:report_id>/', dashboard_views.delete_report, name='delete_report'),
     path('results/', dashboard_views.results_view, name='results'),
     path('results/toggle-certificate/<str:area_id>/', dashboard_views.toggle_certificate_view, name='toggle_certificate'),
@@ -115,6 +116,7 @@ urlpatterns = [
     path('settings/appearance/save-title/', dashboard_views.save_system_title, name='save_system_title'),
     path('settings/appearance/upload-background/', dashboard_views.upload_background, name='upload_background'),
     path('settings/appearance/remove-background/', dashboard_views.remove_background, name='remove_background'),
+    path('settings/appearance/update/', dashboard_views.update_appearance_view, name='update_appearance'),
     
     path('change-password/', dashboard_views.change_password_view, name='change_password'),
     
@@ -6,16 +6,21 @@ Updated: 2025-11-03 - Fixed list/dict handling
 
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_http_methods
-from accreditation.decorators import login_required
+from django.views.decorators.vary import vary_on_cookie
+from accreditation.decorators import login_required, require_role_json
 from accreditation.firebase_utils import (
     get_all_documents, 
     get_document, 
     create_document, 
     update_document, 
     delete_document,
-    query_documents
+    query_documents,
+    query_documents_multi,
+    stream_documents,
+    get_active_documents
 )
 from accreditation.audit_utils import log_audit, get_client_ip
 from accreditation.forms import UserManagementForm
@@ -25,9 +30,20 @@ from accreditation.cloudinary_utils import upload_image_to_cloudinary, delete_im
 from accreditation.document_validator import validate_document_header
 import json
 import hashlib
+import logging
 import secrets
+import threading
+import time
 import traceback
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
 
 
 def get_session_user_dict(request):
@@ -41,7 +57,7 @@ def get_session_user_dict(request):
     return session_user
 
 
-def safe_get_document(collection, doc_id, request=None):
+def safe_get_document(collection, doc_id, request=None, fields=None):
     """
     Safely get a document from Firestore, ensuring it's always a dict.
     Handles cases where get_document returns a list instead of dict.
@@ -50,26 +66,570 @@ def safe_get_document(collection, doc_id, request=None):
         collection: Firestore collection name
         doc_id: Document ID
         request: Optional request object for caching
+        fields: Optional list of field paths to project server-side
         
     Returns:
         dict: Document data or empty dict if not found
     """
-    doc = get_document(collection, doc_id, request=request)
-    
-    # Handle list response
-    if isinstance(doc, list):
-        if len(doc) > 0:
-            return doc[0] if isinstance(doc[0], dict) else {}
-        return {}
-    
-    # Handle dict response
+    doc = get_document(collection, doc_id, request=request, fields=fields)
+
+    # Handle dict response first - by far the most common case
     if isinstance(doc, dict):
         return doc
-    
+
+    # Handle list response (truthiness check instead of len())
+    if isinstance(doc, list) and doc:
+        return doc[0] if isinstance(doc[0], dict) else {}
+
     # Handle None or other types
     return {}
 
 
+def query_documents_in(collection, field, values, request=None):
+    """
+    Query documents where `field` matches any of `values`.
+    Firestore limits 'in' queries to 30 values, so larger lists are chunked
+    into multiple queries and the results combined.
+
+    Args:
+        collection: Firestore collection name
+        field: Field name to match against
+        values: Iterable of values to match
+        request: Optional request object for caching
+
+    Returns:
+        list: Matching documents
+    """
+    values = [v for v in values if v]
+    results = []
+    for start in range(0, len(values), 30):
+        chunk = values[start:start + 30]
+        results.extend(query_documents(collection, field, 'in', chunk, request=request))
+    return results
+
+
+def group_areas_by_type(areas):
+    """
+    Group areas by their owning accreditation type in a single pass.
+
+    Areas reference their type through either 'type_id' or
+    'accreditation_type_id', so the fallback is resolved once here instead
+    of re-evaluating it for every (type, area) comparison.
+
+    Args:
+        areas: List of area documents
+
+    Returns:
+        dict: type id -> list of area documents
+    """
+    areas_by_type = {}
+    for area in areas:
+        type_id = area.get('type_id') or area.get('accreditation_type_id')
+        areas_by_type.setdefault(type_id, []).append(area)
+    return areas_by_type
+
+
+_USER_NAME_CACHE_TTL = 60
+_user_name_cache = {'ts': 0.0, 'map': {}}
+
+
+def get_user_name_map():
+    """
+    Map user emails to display names, refreshed at most once per minute.
+
+    reports_view and generate_report both need this mapping; the short
+    module-level TTL keeps the users collection to one fetch per minute
+    instead of one per request, and display names change rarely enough
+    that a minute of staleness is fine.
+
+    Returns:
+        dict: email -> "First Last" (falling back to the email itself)
+    """
+    now = time.time()
+    if now - _user_name_cache['ts'] > _USER_NAME_CACHE_TTL:
+        users = get_all_documents('users')
+        _user_name_cache['map'] = {
+            u['email']: f"{u.get('first_name', '')} {u.get('last_name', '')}".strip() or u['email']
+            for u in users if u.get('email')
+        }
+        _user_name_cache['ts'] = now
+    return _user_name_cache['map']
+
+
+def cached_get_all_documents(collection_name, request=None):
+    """
+    Fetch a collection once per request.
+
+    Report generation touches the same collections from several helpers;
+    memoizing on the request object keeps each collection to a single
+    Firestore fetch per request with no cross-request staleness.
+
+    Args:
+        collection_name: Name of the collection
+        request: Optional request object carrying the memo
+
+    Returns:
+        list: Documents in the collection
+    """
+    if request is None:
+        return get_all_documents(collection_name)
+
+    cache = getattr(request, '_collections_cache', None)
+    if cache is None:
+        cache = request._collections_cache = {}
+    if collection_name not in cache:
+        cache[collection_name] = get_all_documents(collection_name)
+    return cache[collection_name]
+
+
+def cached_get_active_documents(collection_name, request=None):
+    """
+    Fetch the active, non-archived slice of a collection once per request.
+
+    Same memo as cached_get_all_documents but backed by the server-side
+    filtered query, so archived documents are never transferred.
+    """
+    if request is None:
+        return get_active_documents(collection_name)
+
+    cache = getattr(request, '_collections_cache', None)
+    if cache is None:
+        cache = request._collections_cache = {}
+    cache_key = f"{collection_name}:active"
+    if cache_key not in cache:
+        cache[cache_key] = get_active_documents(collection_name)
+    return cache[cache_key]
+
+
+def fetch_collections_parallel(active_names, all_names=(), request=None):
+    """
+    Fetch several independent collections concurrently.
+
+    Each collection read is a separate Firestore RPC, so issuing them from a
+    thread pool collapses the sequential round-trip latencies into roughly
+    one. Results still go through the per-request memo, so repeat calls
+    within the same request stay free.
+
+    Args:
+        active_names: Collection names to fetch via cached_get_active_documents
+        all_names: Collection names to fetch via cached_get_all_documents
+        request: Optional request object carrying the memo
+
+    Returns:
+        dict: Collection name -> list of documents
+    """
+    with ThreadPoolExecutor(max_workers=len(active_names) + len(all_names)) as executor:
+        futures = {
+            name: executor.submit(cached_get_active_documents, name, request=request)
+            for name in active_names
+        }
+        futures.update({
+            name: executor.submit(cached_get_all_documents, name, request=request)
+            for name in all_names
+        })
+        return {name: future.result() for name, future in futures.items()}
+
+
+def build_relation_indexes(programs, types, areas, checklists):
+    """
+    Index the accreditation hierarchy by foreign key, one pass per level.
+
+    Replaces the repeated linear filter comprehensions (programs by
+    department, types by program, areas by type, checklists by area) with
+    O(1) dict lookups.
+
+    Args:
+        programs: Iterable of program documents
+        types: Iterable of accreditation type documents
+        areas: Iterable of area documents
+        checklists: Iterable of checklist documents
+
+    Returns:
+        tuple: (programs_by_dept, types_by_program, areas_by_type,
+        checklists_by_area) dicts mapping parent id -> list of children
+    """
+    programs_by_dept = {}
+    for prog in programs:
+        programs_by_dept.setdefault(prog.get('department_id'), []).append(prog)
+
+    types_by_program = {}
+    for accred_type in types:
+        types_by_program.setdefault(accred_type.get('program_id'), []).append(accred_type)
+
+    areas_by_type = group_areas_by_type(areas)
+
+    checklists_by_area = {}
+    for checklist in checklists:
+        checklists_by_area.setdefault(checklist.get('area_id'), []).append(checklist)
+
+    return programs_by_dept, types_by_program, areas_by_type, checklists_by_area
+
+
+def compute_progress_maps(types, areas, checklists, documents):
+    """
+    Compute progress percentages for the whole accreditation tree in single
+    bottom-up passes instead of re-scanning child collections per parent.
+
+    A checklist is complete when it has at least one approved, non-archived
+    required document. Area progress is the percentage of complete checklists,
+    type progress the average of its areas, program progress the average of
+    its types.
+
+    Args:
+        types: Iterable of accreditation type documents
+        areas: Iterable of area documents
+        checklists: Iterable of checklist documents
+        documents: Iterable of uploaded documents
+
+    Returns:
+        tuple: (area_progress, type_progress, program_progress) dicts keyed
+        by entity id. Entities with no children are absent; callers should
+        default missing ids to 0.
+    """
+    # One pass over documents: which checklists are complete
+    approved_checklist_ids = {
+        doc.get('checklist_id') for doc in documents
+        if doc.get('is_required', False)
+        and not doc.get('is_archived', False)
+        and doc.get('status') == 'approved'
+    }
+
+    # One pass over checklists: per-area totals and completed counts
+    area_total = {}
+    area_completed = {}
+    for checklist in checklists:
+        area_id = checklist.get('area_id')
+        area_total[area_id] = area_total.get(area_id, 0) + 1
+        if checklist.get('id') in approved_checklist_ids:
+            area_completed[area_id] = area_completed.get(area_id, 0) + 1
+
+    area_progress = {
+        area_id: (area_completed.get(area_id, 0) / total) * 100
+        for area_id, total in area_total.items()
+    }
+
+    # One pass over areas: average area progress per type
+    type_sums = {}
+    type_counts = {}
+    for area in areas:
+        type_id = area.get('type_id') or area.get('accreditation_type_id')
+        type_sums[type_id] = type_sums.get(type_id, 0) + area_progress.get(area.get('id'), 0)
+        type_counts[type_id] = type_counts.get(type_id, 0) + 1
+
+    type_progress = {
+        type_id: type_sums[type_id] / count
+        for type_id, count in type_counts.items()
+    }
+
+    # One pass over types: average type progress per program
+    # (types with no areas count as 0, matching the per-view loops)
+    program_sums = {}
+    program_counts = {}
+    for accred_type in types:
+        program_id = accred_type.get('program_id')
+        program_sums[program_id] = program_sums.get(program_id, 0) + type_progress.get(accred_type.get('id'), 0)
+        program_counts[program_id] = program_counts.get(program_id, 0) + 1
+
+    program_progress = {
+        program_id: program_sums[program_id] / count
+        for program_id, count in program_counts.items()
+    }
+
+    return area_progress, type_progress, program_progress
+
+
+def compute_department_performance(departments, programs, types, areas, checklists, approved_counts, required_counts=None):
+    """
+    Walk the department hierarchy once and aggregate per-department stats.
+
+    Shared by performance_view and the performance analytics report so the
+    nested department -> program -> type -> area -> checklist traversal only
+    exists in one place. Callers supply per-checklist document counts built
+    with whatever predicate their report uses, then read either the
+    hierarchical progress average or the raw document counts.
+
+    Args:
+        departments: Department documents
+        programs: Program documents
+        types: Accreditation type documents
+        areas: Area documents
+        checklists: Checklist documents
+        approved_counts: dict checklist id -> approved document count
+        required_counts: Optional dict checklist id -> required document count
+
+    Returns:
+        list: One dict per department with the department document under
+        'dept' plus count aggregates and the unrounded hierarchical progress
+    """
+    programs_by_dept, types_by_program, areas_by_type, checklists_by_area = build_relation_indexes(
+        programs, types, areas, checklists
+    )
+
+    results = []
+    for dept in departments:
+        dept_programs = programs_by_dept.get(dept.get('id'), [])
+        types_count = 0
+        areas_count = 0
+        checklists_count = 0
+        completed_checklists = 0
+        approved_docs = 0
+        required_docs = 0
+
+        if not dept_programs:
+            dept_progress = 0
+        else:
+            program_progresses = []
+            for prog in dept_programs:
+                prog_types = types_by_program.get(prog.get('id'), [])
+                types_count += len(prog_types)
+
+                if not prog_types:
+                    program_progresses.append(0)
+                    continue
+
+                type_progresses = []
+                for prog_type in prog_types:
+                    type_areas = areas_by_type.get(prog_type.get('id'), [])
+                    areas_count += len(type_areas)
+
+                    if not type_areas:
+                        type_progresses.append(0)
+                        continue
+
+                    area_progresses = []
+                    for area in type_areas:
+                        area_checklists = checklists_by_area.get(area.get('id'), [])
+
+                        if not area_checklists:
+                            area_progresses.append(0)
+                            continue
+
+                        checklists_count += len(area_checklists)
+
+                        area_completed = 0
+                        for checklist in area_checklists:
+                            checklist_id = checklist.get('id')
+                            approved = approved_counts.get(checklist_id, 0)
+                            approved_docs += approved
+                            if required_counts is not None:
+                                required_docs += required_counts.get(checklist_id, 0)
+                            if approved:
+                                area_completed += 1
+
+                        completed_checklists += area_completed
+                        area_progresses.append(area_completed * (100.0 / len(area_checklists)))
+
+                    type_progresses.append(sum(area_progresses) / len(area_progresses) if area_progresses else 0)
+
+                program_progresses.append(sum(type_progresses) / len(type_progresses) if type_progresses else 0)
+
+            dept_progress = sum(program_progresses) / len(program_progresses) if program_progresses else 0
+
+        results.append({
+            'dept': dept,
+            'programs_count': len(dept_programs),
+            'types_count': types_count,
+            'areas_count': areas_count,
+            'checklists_count': checklists_count,
+            'completed_checklists': completed_checklists,
+            'approved_docs': approved_docs,
+            'required_docs': required_docs,
+            'hierarchical_progress': dept_progress,
+        })
+
+    return results
+
+
+def build_results_rows(department_id=None, program_id=None, type_id=None, request=None):
+    """
+    Build the per-area results records shared by the results page and the
+    results/incentives Excel report.
+
+    Resolves each active area to its type, program and department and counts
+    its checklists with at least one approved, non-archived required
+    document. Callers derive their own display fields (rounded progress,
+    certificate/incentive labels) from the returned counts.
+
+    Args:
+        department_id: Optional department id to scope to
+        program_id: Optional program id to scope to
+        type_id: Optional accreditation type id to scope to
+        request: Optional request-like object for per-request memoization
+
+    Returns:
+        list: One dict per resolvable area with 'area', 'department',
+        'program' and 'type' documents plus 'completed_checklists' and
+        'total_checklists' counts
+    """
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types', 'areas'],
+        ['checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
+
+    if department_id:
+        departments = [d for d in departments if d.get('id') == department_id]
+    if program_id:
+        programs = [p for p in programs if p.get('id') == program_id]
+    if type_id:
+        types = [t for t in types if t.get('id') == type_id]
+
+    # Index checklists by area and the ancestor collections by id so the
+    # per-area loop below does O(1) lookups instead of full scans
+    checklists_by_area = {}
+    for checklist in checklists:
+        checklists_by_area.setdefault(checklist.get('area_id'), []).append(checklist)
+    types_by_id = {t.get('id'): t for t in types}
+    programs_by_id = {p.get('id'): p for p in programs}
+    departments_by_id = {d.get('id'): d for d in departments}
+
+    # Checklists that have at least one approved required document (one pass
+    # over documents instead of a rescan per checklist)
+    approved_checklist_ids = {
+        doc.get('checklist_id') for doc in documents
+        if doc.get('is_required', False)
+        and not doc.get('is_archived', False)
+        and doc.get('status') == 'approved'
+    }
+
+    rows = []
+    for area in areas:
+        area_type_id = area.get('type_id') or area.get('accreditation_type_id')
+        accred_type = types_by_id.get(area_type_id)
+        if not accred_type:
+            continue
+
+        program = programs_by_id.get(accred_type.get('program_id'))
+        if not program:
+            continue
+
+        department = departments_by_id.get(program.get('department_id'))
+        if not department:
+            continue
+
+        area_checklists = checklists_by_area.get(area.get('id'), [])
+        completed = sum(1 for c in area_checklists if c.get('id') in approved_checklist_ids)
+
+        rows.append({
+            'area': area,
+            'department': department,
+            'program': program,
+            'type': accred_type,
+            'completed_checklists': completed,
+            'total_checklists': len(area_checklists),
+        })
+
+    return rows
+
+
+def sort_by_field(items, field, default='', reverse=False):
+    """
+    Sort a list of dicts in place by one field using a C-level itemgetter key.
+
+    Missing values are filled with `default` first so itemgetter never
+    raises; this avoids a Python-level lambda frame per comparison.
+    """
+    for item in items:
+        item.setdefault(field, default)
+    items.sort(key=itemgetter(field), reverse=reverse)
+
+
+def progress_pct(completed, total, ndigits=1):
+    """
+    Percentage of completed over total, rounded, with a zero-total guard.
+
+    Shared by the report generators so the guard-and-round arithmetic is
+    written (and branch-predicted) in one place rather than inlined per
+    loop body.
+    """
+    return round((completed / total * 100) if total > 0 else 0, ndigits)
+
+
+# Roles allowed to manage settings, users and accreditation structure
+ADMIN_ROLES = frozenset({'qa_head', 'qa_admin'})
+
+# Login background applied when none has been uploaded (or after removal)
+DEFAULT_LOGIN_BG_URL = 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+
+def is_cloudinary_url(url, account='dygrh6ztt'):
+    """
+    Check whether a URL points at an asset in our Cloudinary account.
+
+    Parses the host and path instead of substring-matching, so a URL
+    that merely mentions 'cloudinary' somewhere cannot trigger a delete.
+    """
+    if not url:
+        return False
+    parsed = urlparse(url)
+    return parsed.netloc.endswith('cloudinary.com') and f'/{account}/' in parsed.path
+
+
+# Status labels per progress bracket: < 40, 40-59, 60-79, >= 80
+_PERFORMANCE_STATUSES = ('Critical', 'Needs Work', 'Good', 'Excellent')
+_PERFORMANCE_THRESHOLDS = (40, 60, 80)
+
+# Magic-byte signatures for the image formats profile uploads accept
+# (JPEG and PNG); checked instead of the client-supplied Content-Type
+_IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n')
+
+
+# Display titles per report type, shared by the PDF and Excel generators
+_REPORT_TITLES = {
+    'complete_accreditation': 'Complete Accreditation Report',
+    'results_incentives': 'Results and Incentives Report',
+    'performance_analytics': 'Performance Analytics Report',
+}
+
+
+def performance_status(progress):
+    """Bucket a progress percentage into the report status labels (80/60/40 thresholds)"""
+    return _PERFORMANCE_STATUSES[bisect_right(_PERFORMANCE_THRESHOLDS, progress)]
+
+
+def delete_image_in_background(image_url):
+    """
+    Delete a Cloudinary image on a background thread.
+
+    Used when a view replaces or removes an image the user no longer
+    needs: the second Cloudinary round-trip should not hold up the
+    response. Failures are logged and swallowed; a leaked orphan image
+    is preferable to failing the request.
+    """
+    def _delete():
+        try:
+            delete_image_from_cloudinary(image_url)
+        except Exception:
+            logger.exception("Background Cloudinary delete failed")
+
+    threading.Thread(target=_delete, daemon=True).start()
+
+
+# Allowance for multipart boundaries/headers around the file payload
+_MULTIPART_OVERHEAD = 16 * 1024
+
+
+def upload_exceeds_limit(request, limit):
+    """
+    Check the declared Content-Length against an upload size limit.
+
+    Called before request.FILES is touched, so oversize bodies are
+    rejected without Django parsing and buffering them. The header is
+    client-supplied, so callers still run their per-file size check
+    after parsing.
+    """
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except (TypeError, ValueError):
+        return False
+    return content_length > limit + _MULTIPART_OVERHEAD
+
+
 def hash_password(raw_password):
     """Hash a password using PBKDF2"""
     salt = secrets.token_hex(16)
@@ -132,8 +692,18 @@ def calendar_view(request):
 
 
 @login_required
+@cache_page(60)
+@vary_on_cookie
 def accreditation_view(request):
-    """Accreditation page - displays all active items"""
+    """
+    Accreditation page - displays all active items
+
+    The rendered page is cached for 60 seconds per session. vary_on_cookie
+    must sit inside cache_page: the cache key is learned from this view's
+    response before SessionMiddleware gets to patch the Vary header, so
+    without it the page would be cached with no cookie variance and served
+    across users. The short TTL keeps staleness acceptable.
+    """
     user = get_user_from_session(request)
     
     # Fetch all active departments
@@ -152,10 +722,10 @@ def accreditation_view(request):
                 dept['logo_url'] = ''
         
         # Sort by name
-        departments.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(departments, 'name')
         
     except Exception as e:
-        print(f"Error fetching departments: {str(e)}")
+        logger.exception("Error fetching departments")
         departments = []
     
     # Fetch all active programs
@@ -169,10 +739,10 @@ def accreditation_view(request):
         ]
         
         # Sort by code
-        programs.sort(key=lambda x: x.get('code', ''))
+        sort_by_field(programs, 'code')
         
     except Exception as e:
-        print(f"Error fetching programs: {str(e)}")
+        logger.exception("Error fetching programs")
         programs = []
     
     # Fetch all active accreditation types
@@ -186,10 +756,10 @@ def accreditation_view(request):
         ]
         
         # Sort by type name
-        types.sort(key=lambda x: x.get('type', ''))
+        sort_by_field(types, 'type')
         
     except Exception as e:
-        print(f"Error fetching types: {str(e)}")
+        logger.exception("Error fetching types")
         types = []
     
     # Fetch all active areas
@@ -203,87 +773,36 @@ def accreditation_view(request):
         ]
         
         # Sort by name
-        areas.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(areas, 'name')
         
     except Exception as e:
-        print(f"Error fetching areas: {str(e)}")
+        logger.exception("Error fetching areas")
         areas = []
     
     # Calculate progress for each department based on its programs
     try:
-        all_checklists = get_all_documents('checklists')
-        all_documents = get_all_documents('documents')
-        
+        # Aggregate the whole tree bottom-up in single passes, streaming the
+        # two large collections instead of materializing them as lists
+        area_progress, type_progress, program_progress = compute_progress_maps(
+            types, areas, stream_documents('checklists'), stream_documents('documents')
+        )
+
         for dept in departments:
-            dept_id = dept.get('id')
-            # Get all programs for this department
-            dept_programs = [p for p in programs if p.get('department_id') == dept_id]
-            
-            if not dept_programs:
-                dept['progress'] = 0
-                continue
-            
-            # Calculate progress for each program first
-            program_progresses = []
-            for prog in dept_programs:
-                prog_id = prog.get('id')
-                prog_types = [t for t in types if t.get('program_id') == prog_id]
-                
-                if not prog_types:
-                    program_progresses.append(0)
-                    continue
-                
-                # Calculate progress for each type
-                type_progresses = []
-                for prog_type in prog_types:
-                    type_id = prog_type.get('id')
-                    type_areas = [a for a in areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
-                    
-                    if not type_areas:
-                        type_progresses.append(0)
-                        continue
-                    
-                    # Calculate progress for each area
-                    area_progresses = []
-                    for area in type_areas:
-                        area_id = area.get('id')
-                        area_checklists = [c for c in all_checklists if c.get('area_id') == area_id]
-                        
-                        if not area_checklists:
-                            area_progresses.append(0)
-                            continue
-                        
-                        total_checklists = len(area_checklists)
-                        completed_checklists = 0
-                        
-                        for checklist in area_checklists:
-                            checklist_id = checklist.get('id')
-                            required_docs = [
-                                doc for doc in all_documents 
-                                if doc.get('checklist_id') == checklist_id 
-                                and doc.get('is_required', False)
-                                and not doc.get('is_archived', False)
-                                and doc.get('status') == 'approved'
-                            ]
-                            if len(required_docs) > 0:
-                                completed_checklists += 1
-                        
-                        area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
-                        area_progresses.append(area_progress)
-                    
-                    # Type progress is average of its areas
-                    type_progress = sum(area_progresses) / len(area_progresses) if area_progresses else 0
-                    type_progresses.append(type_progress)
-                
-                # Program progress is average of its types
-                program_progress = sum(type_progresses) / len(type_progresses) if type_progresses else 0
-                program_progresses.append(program_progress)
-            
+            dept_id = dept.get('id')
+            # Get all programs for this department
+            dept_programs = [p for p in programs if p.get('department_id') == dept_id]
+
+            if not dept_programs:
+                dept['progress'] = 0
+                continue
+
             # Department progress is the average of its programs' progress
-            dept['progress'] = round(sum(program_progresses) / len(program_progresses)) if program_progresses else 0
-            
+            dept['progress'] = round(
+                sum(program_progress.get(p.get('id'), 0) for p in dept_programs) / len(dept_programs)
+            )
+
     except Exception as e:
-        print(f"Error calculating department progress: {str(e)}")
+        logger.exception("Error calculating department progress")
         for dept in departments:
             dept['progress'] = 0
     
@@ -310,27 +829,50 @@ def accreditation_department_programs_view(request, dept_id):
             messages.error(request, 'Department not found.')
             return redirect('dashboard:accreditation')
     except Exception as e:
-        print(f"Error fetching department: {str(e)}")
+        logger.exception("Error fetching department")
         messages.error(request, 'Error fetching department.')
         return redirect('dashboard:accreditation')
-    
+
     # Get all active programs for this department
     try:
-        all_programs = get_all_documents('programs')
+        all_programs = query_documents('programs', 'department_id', '==', dept_id, request=request)
         programs = [
-            prog for prog in all_programs 
-            if prog.get('department_id') == dept_id 
-            and prog.get('is_active', True) 
+            prog for prog in all_programs
+            if prog.get('is_active', True)
             and not prog.get('is_archived', False)
         ]
-        programs.sort(key=lambda x: x.get('code', ''))
-        
+        sort_by_field(programs, 'code')
+
         # Calculate progress for each program based on its types
-        all_types = get_all_documents('accreditation_types')
-        all_areas = get_all_documents('areas')
-        all_checklists = get_all_documents('checklists')
-        all_documents = get_all_documents('documents')
-        
+        # Only fetch this department's subtree instead of the full collections
+        prog_ids = [p.get('id') for p in programs]
+        all_types = query_documents_in('accreditation_types', 'program_id', prog_ids, request=request)
+
+        type_ids = [t.get('id') for t in all_types]
+        # Areas may reference their type via either field, so query both and de-duplicate
+        areas_by_id = {}
+        for area in query_documents_in('areas', 'type_id', type_ids, request=request):
+            areas_by_id[area.get('id')] = area
+        for area in query_documents_in('areas', 'accreditation_type_id', type_ids, request=request):
+            areas_by_id[area.get('id')] = area
+        all_areas = list(areas_by_id.values())
+        areas_by_type = group_areas_by_type(all_areas)
+
+        area_ids = [a.get('id') for a in all_areas]
+        all_checklists = query_documents_in('checklists', 'area_id', area_ids, request=request)
+
+        checklist_ids = [c.get('id') for c in all_checklists]
+        all_documents = query_documents_in('documents', 'checklist_id', checklist_ids, request=request)
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
+
         for prog in programs:
             prog_id = prog.get('id')
             # Get all types for this program
@@ -344,7 +886,7 @@ def accreditation_department_programs_view(request, dept_id):
             type_progresses = []
             for prog_type in prog_types:
                 type_id = prog_type.get('id')
-                type_areas = [a for a in all_areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+                type_areas = areas_by_type.get(type_id, [])
                 
                 if not type_areas:
                     type_progresses.append(0)
@@ -361,21 +903,12 @@ def accreditation_department_programs_view(request, dept_id):
                         continue
                     
                     total_checklists = len(area_checklists)
-                    completed_checklists = 0
-                    
-                    for checklist in area_checklists:
-                        checklist_id = checklist.get('id')
-                        required_docs = [
-                            doc for doc in all_documents 
-                            if doc.get('checklist_id') == checklist_id 
-                            and doc.get('is_required', False)
-                            and not doc.get('is_archived', False)
-                            and doc.get('status') == 'approved'
-                        ]
-                        if len(required_docs) > 0:
-                            completed_checklists += 1
+                    completed_checklists = sum(
+                        1 for checklist in area_checklists
+                        if checklist.get('id') in approved_checklist_ids
+                    )
                     
-                    area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
+                    area_progress = completed_checklists * (100.0 / total_checklists)
                     area_progresses.append(area_progress)
                 
                 # Type progress is average of its areas
@@ -386,7 +919,7 @@ def accreditation_department_programs_view(request, dept_id):
             prog['progress'] = round(sum(type_progresses) / len(type_progresses)) if type_progresses else 0
             
     except Exception as e:
-        print(f"Error fetching programs: {str(e)}")
+        logger.exception("Error fetching programs")
         programs = []
     
     context = {
@@ -412,7 +945,7 @@ def accreditation_program_types_view(request, dept_id, prog_id):
             messages.error(request, 'Department or Program not found.')
             return redirect('dashboard:accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:accreditation')
     
@@ -425,17 +958,27 @@ def accreditation_program_types_view(request, dept_id, prog_id):
             and t.get('is_active', True) 
             and not t.get('is_archived', False)
         ]
-        types.sort(key=lambda x: x.get('type', ''))
+        sort_by_field(types, 'type')
         
         # Calculate progress for each type based on its areas
         all_areas = get_all_documents('areas')
+        areas_by_type = group_areas_by_type(all_areas)
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         for accred_type in types:
             type_id = accred_type.get('id')
             # Get all areas for this type (check both type_id and accreditation_type_id)
-            type_areas = [a for a in all_areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+            type_areas = areas_by_type.get(type_id, [])
             
             if not type_areas:
                 accred_type['progress'] = 0
@@ -452,28 +995,19 @@ def accreditation_program_types_view(request, dept_id, prog_id):
                     continue
                 
                 total_checklists = len(area_checklists)
-                completed_checklists = 0
-                
-                for checklist in area_checklists:
-                    checklist_id = checklist.get('id')
-                    required_docs = [
-                        doc for doc in all_documents 
-                        if doc.get('checklist_id') == checklist_id 
-                        and doc.get('is_required', False)
-                        and not doc.get('is_archived', False)
-                        and doc.get('status') == 'approved'
-                    ]
-                    if len(required_docs) > 0:
-                        completed_checklists += 1
+                completed_checklists = sum(
+                    1 for checklist in area_checklists
+                    if checklist.get('id') in approved_checklist_ids
+                )
                 
-                area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
+                area_progress = completed_checklists * (100.0 / total_checklists)
                 area_progresses.append(area_progress)
             
             # Type progress is the average of its areas' progress
             accred_type['progress'] = round(sum(area_progresses) / len(area_progresses)) if area_progresses else 0
             
     except Exception as e:
-        print(f"Error fetching types: {str(e)}")
+        logger.exception("Error fetching types")
         types = []
     
     context = {
@@ -502,7 +1036,7 @@ def accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             messages.error(request, 'Data not found.')
             return redirect('dashboard:accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:accreditation')
     
@@ -515,11 +1049,20 @@ def accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             and mod.get('is_active', True) 
             and not mod.get('is_archived', False)
         ]
-        areas.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(areas, 'name')
         
         # Calculate progress for each area
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         for area in areas:
             area_id = area.get('id')
@@ -532,24 +1075,15 @@ def accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             
             # Calculate progress based on required documents
             total_checklists = len(area_checklists)
-            completed_checklists = 0
-            
-            for checklist in area_checklists:
-                checklist_id = checklist.get('id')
-                required_docs = [
-                    doc for doc in all_documents 
-                    if doc.get('checklist_id') == checklist_id 
-                    and doc.get('is_required', False)
-                    and not doc.get('is_archived', False)
-                    and doc.get('status') == 'approved'
-                ]
-                if len(required_docs) > 0:
-                    completed_checklists += 1
+            completed_checklists = sum(
+                1 for checklist in area_checklists
+                if checklist.get('id') in approved_checklist_ids
+            )
             
-            area['progress'] = round((completed_checklists / total_checklists) * 100) if total_checklists > 0 else 0
+            area['progress'] = round(completed_checklists * (100.0 / total_checklists))
             
     except Exception as e:
-        print(f"Error fetching areas: {str(e)}")
+        logger.exception("Error fetching areas")
         areas = []
     
     context = {
@@ -571,20 +1105,27 @@ def accreditation_area_checklists_view(request, dept_id, prog_id, type_id, area_
     """Accreditation Checklists page - read-only view of checklists under a area"""
     user = get_user_from_session(request)
     
-    # Get breadcrumb info
-    try:
-        department = get_document('departments', dept_id)
-        program = get_document('programs', prog_id)
-        accreditation_type = get_document('accreditation_types', type_id)
-        area = get_document('areas', area_id)
+    # Get breadcrumb info - fan out the four lookups in parallel instead of
+    # paying four serial Firestore round-trips
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            department, program, accreditation_type, area = executor.map(
+                lambda args: get_document(*args),
+                [
+                    ('departments', dept_id),
+                    ('programs', prog_id),
+                    ('accreditation_types', type_id),
+                    ('areas', area_id),
+                ]
+            )
         if not department or not program or not accreditation_type or not area:
             messages.error(request, 'Data not found.')
             return redirect('dashboard:accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:accreditation')
-    
+
     # Get all active checklists for this area
     try:
         all_checklists = get_all_documents('checklists')
@@ -594,27 +1135,27 @@ def accreditation_area_checklists_view(request, dept_id, prog_id, type_id, area_
             and checklist.get('is_active', True) 
             and not checklist.get('is_archived', False)
         ]
-        checklists.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(checklists, 'name')
         
         # Get all documents to calculate progress for each checklist
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         # Add progress percentage to each checklist
         for checklist in checklists:
-            checklist_id = checklist.get('id')
-            # Get required documents for this checklist
-            required_docs = [
-                doc for doc in all_documents 
-                if doc.get('checklist_id') == checklist_id 
-                and doc.get('is_required', False)
-                and not doc.get('is_archived', False)
-                and doc.get('status') == 'approved'
-            ]
-            # Progress is 100% if there's at least 1 required document, otherwise 0%
-            checklist['progress'] = 100 if len(required_docs) > 0 else 0
+            # Progress is 100% if there's at least 1 approved required document, otherwise 0%
+            checklist['progress'] = 100 if checklist.get('id') in approved_checklist_ids else 0
             
     except Exception as e:
-        print(f"Error fetching checklists: {str(e)}")
+        logger.exception("Error fetching checklists")
         checklists = []
     
     context = {
@@ -640,147 +1181,75 @@ def performance_view(request):
     
     try:
         # Fetch all data
-        departments = get_all_documents('departments')
-        departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-        
-        programs = get_all_documents('programs')
-        programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
+        departments = cached_get_active_documents('departments', request=request)
         
-        types = get_all_documents('accreditation_types')
-        types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
-        
-        areas = get_all_documents('areas')
-        areas = [a for a in areas if a.get('is_active', True) and not a.get('is_archived', False)]
-        
-        all_checklists = get_all_documents('checklists')
-        # Filter to get only active checklists
-        active_checklists = [c for c in all_checklists if c.get('is_active', False) and not c.get('is_archived', False)]
+        programs = cached_get_active_documents('programs', request=request)
         
-        all_documents = get_all_documents('documents')
-        # Filter to get only active documents
-        active_documents = [d for d in all_documents if d.get('is_active', False) and not d.get('is_archived', False)]
+        types = cached_get_active_documents('accreditation_types', request=request)
         
-        # Calculate progress for each department
+        areas = cached_get_active_documents('areas', request=request)
+
+        active_checklists = cached_get_active_documents('checklists', request=request)
+
+        active_documents = cached_get_active_documents('documents', request=request)
+
+        # One pass over documents: approved count per checklist
+        approved_counts = {}
+        for doc in active_documents:
+            if doc.get('status') == 'approved':
+                checklist_id = doc.get('checklist_id')
+                approved_counts[checklist_id] = approved_counts.get(checklist_id, 0) + 1
+
+        # Calculate progress for each department via the shared hierarchy walk
+        dept_rows = compute_department_performance(
+            departments, programs, types, areas, active_checklists, approved_counts
+        )
+
         department_stats = []
         total_required_docs = 0
         total_uploaded_docs = 0
         total_checklists_count = len(active_checklists)
         total_completed_checklists = 0
-        
-        for dept in departments:
-            dept_id = dept.get('id')
-            dept_programs = [p for p in programs if p.get('department_id') == dept_id]
-            
-            dept_required_docs = 0
-            dept_uploaded_docs = 0
-            dept_checklists = 0
-            dept_completed_checklists = 0
-            
-            if not dept_programs:
-                dept_progress = 0
-            else:
-                program_progresses = []
-                for prog in dept_programs:
-                    prog_id = prog.get('id')
-                    prog_types = [t for t in types if t.get('program_id') == prog_id]
-                    
-                    if not prog_types:
-                        program_progresses.append(0)
-                        continue
-                    
-                    type_progresses = []
-                    for prog_type in prog_types:
-                        type_id = prog_type.get('id')
-                        type_areas = [a for a in areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
-                        
-                        if not type_areas:
-                            type_progresses.append(0)
-                            continue
-                        
-                        area_progresses = []
-                        for area in type_areas:
-                            area_id = area.get('id')
-                            area_checklists = [c for c in active_checklists if c.get('area_id') == area_id]
-                            
-                            if not area_checklists:
-                                area_progresses.append(0)
-                                continue
-                            
-                            dept_checklists += len(area_checklists)
-                            
-                            area_completed = 0
-                            for checklist in area_checklists:
-                                checklist_id = checklist.get('id')
-                                # Check if checklist has at least one approved document
-                                checklist_docs = [
-                                    doc for doc in active_documents 
-                                    if doc.get('checklist_id') == checklist_id
-                                ]
-                                
-                                has_approved = any(d.get('status') == 'approved' for d in checklist_docs)
-                                
-                                if has_approved:
-                                    area_completed += 1
-                                    dept_completed_checklists += 1
-                                    total_completed_checklists += 1
-                                
-                                # Count approved documents for this checklist
-                                approved_docs = [d for d in checklist_docs if d.get('status') == 'approved']
-                                dept_uploaded_docs += len(approved_docs)
-                                total_uploaded_docs += len(approved_docs)
-                            
-                            area_progress = (area_completed / len(area_checklists)) * 100 if area_checklists else 0
-                            area_progresses.append(area_progress)
-                        
-                        type_progress = sum(area_progresses) / len(area_progresses) if area_progresses else 0
-                        type_progresses.append(type_progress)
-                    
-                    prog_progress = sum(type_progresses) / len(type_progresses) if type_progresses else 0
-                    program_progresses.append(prog_progress)
-                
-                dept_progress = sum(program_progresses) / len(program_progresses) if program_progresses else 0
-            
-            # Count types and areas for this department
-            dept_types = []
-            dept_areas = []
-            for prog in dept_programs:
-                prog_id = prog.get('id')
-                prog_types = [t for t in types if t.get('program_id') == prog_id]
-                dept_types.extend(prog_types)
-                
-                for prog_type in prog_types:
-                    type_id = prog_type.get('id')
-                    type_areas = [a for a in areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
-                    dept_areas.extend(type_areas)
-            
+
+        for row in dept_rows:
+            dept = row['dept']
+            total_completed_checklists += row['completed_checklists']
+            total_uploaded_docs += row['approved_docs']
+
             department_stats.append({
-                'id': dept_id,
+                'id': dept.get('id'),
                 'name': dept.get('name', 'Unknown'),
                 'logo_url': dept.get('logo_url', ''),
-                'progress': round(dept_progress),
-                'programs_count': len(dept_programs),
-                'types_count': len(dept_types),
-                'areas_count': len(dept_areas),
-                'checklists_count': dept_checklists,
-                'completed_checklists': dept_completed_checklists,
-                'required_docs': dept_required_docs,
-                'uploaded_docs': dept_uploaded_docs,
-                'approved_docs': dept_uploaded_docs,  # Since we're only counting approved docs
+                'progress': round(row['hierarchical_progress']),
+                'programs_count': row['programs_count'],
+                'types_count': row['types_count'],
+                'areas_count': row['areas_count'],
+                'checklists_count': row['checklists_count'],
+                'completed_checklists': row['completed_checklists'],
+                'required_docs': row['required_docs'],
+                'approved_docs': row['approved_docs'],  # Since we're only counting approved docs
                 'updated_at': dept.get('updated_at', '')
             })
         
         # Sort departments by progress (descending)
-        department_stats.sort(key=lambda x: x['progress'], reverse=True)
+        department_stats.sort(key=itemgetter('progress'), reverse=True)
         
         # Calculate overall completion rate (consistent with dashboard)
         # Completion rate = completed checklists / total checklists * 100
         avg_completion = (total_completed_checklists / total_checklists_count * 100) if total_checklists_count > 0 else 0
         
-        # Status distribution
-        excellent_count = len([d for d in department_stats if d['progress'] >= 80])
-        good_count = len([d for d in department_stats if 60 <= d['progress'] < 80])
-        needs_improvement_count = len([d for d in department_stats if 40 <= d['progress'] < 60])
-        critical_count = len([d for d in department_stats if d['progress'] < 40])
+        # Status distribution - bucket all departments in one pass
+        excellent_count = good_count = needs_improvement_count = critical_count = 0
+        for d in department_stats:
+            progress = d['progress']
+            if progress >= 80:
+                excellent_count += 1
+            elif progress >= 60:
+                good_count += 1
+            elif progress >= 40:
+                needs_improvement_count += 1
+            else:
+                critical_count += 1
         
         context = {
             'active_page': 'performance',
@@ -802,7 +1271,7 @@ def performance_view(request):
         }
         
     except Exception as e:
-        print(f"Error in performance view: {str(e)}")
+        logger.exception("Error in performance view")
         context = {
             'active_page': 'performance',
             'user': user,
@@ -832,16 +1301,13 @@ def reports_view(request):
     
     # Fetch filter options
     try:
-        departments = get_all_documents('departments')
-        departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-        departments.sort(key=lambda x: x.get('name', ''))
+        departments = cached_get_active_documents('departments', request=request)
+        sort_by_field(departments, 'name')
         
-        programs = get_all_documents('programs')
-        programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
-        programs.sort(key=lambda x: x.get('code', ''))
+        programs = cached_get_active_documents('programs', request=request)
+        sort_by_field(programs, 'code')
         
-        types = get_all_documents('accreditation_types')
-        types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
+        types = cached_get_active_documents('accreditation_types', request=request)
         
         # Remove duplicates by name (keep first occurrence)
         seen_names = set()
@@ -852,50 +1318,45 @@ def reports_view(request):
                 seen_names.add(type_name)
                 unique_types.append(t)
         
-        unique_types.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(unique_types, 'name')
         types = unique_types
         
         # Fetch reports history
-        reports_history = get_all_documents('reports_history')
+        reports_history = cached_get_all_documents('reports_history', request=request)
         
-        # Enrich reports with user names from users collection
-        users = get_all_documents('users')
-        user_map = {u.get('email'): f"{u.get('first_name', '')} {u.get('last_name', '')}".strip() or u.get('email') for u in users}
+        # Enrich reports with user names (cached email -> name map)
+        user_map = get_user_name_map()
         
         for report in reports_history:
             generated_by = report.get('generated_by', '')
             if generated_by in user_map and not report.get('generated_by_name'):
                 report['generated_by_name'] = user_map[generated_by]
-        
-        # Convert Firebase timestamps to ISO format strings for sorting and display
-        from datetime import datetime
-        for report in reports_history:
-            created_at = report.get('created_at')
-            if created_at and not isinstance(created_at, str):
-                # Convert Firebase DatetimeWithNanoseconds to ISO string
-                try:
-                    report['created_at'] = created_at.isoformat()
-                except:
-                    report['created_at'] = str(created_at)
-        
-        reports_history.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        
+
+        # created_at is stored as an ISO string at write time (see generate_report);
+        # legacy rows with Firestore timestamps are converted once by
+        # migrate_report_timestamps.py, so no per-request conversion is needed
+        sort_by_field(reports_history, 'created_at', reverse=True)
+
         # Calculate stats (using all reports)
         total_reports = len(reports_history)
-        
-        # Reports this month
+
+        # This-month count, total storage and distinct generators in a single
+        # pass over the history instead of three full traversals
         current_month = datetime.now().strftime('%Y-%m')
         reports_this_month = 0
+        total_bytes = 0
+        generators_seen = set()
         for r in reports_history:
             created_at = r.get('created_at', '')
             if isinstance(created_at, str) and created_at.startswith(current_month):
                 reports_this_month += 1
-        
-        # Calculate total storage (in MB)
-        total_storage = sum(r.get('file_size', 0) for r in reports_history) / (1024 * 1024)
-        
-        # Active users generating reports
-        active_users = len(set(r.get('generated_by') for r in reports_history if r.get('generated_by')))
+            total_bytes += r.get('file_size', 0)
+            generated_by = r.get('generated_by')
+            if generated_by:
+                generators_seen.add(generated_by)
+
+        total_storage = total_bytes / (1024 * 1024)  # in MB
+        active_users = len(generators_seen)
         
         # Pagination - 20 reports per page
         from math import ceil
@@ -929,7 +1390,7 @@ def reports_view(request):
                 page_range = [1, '...'] + list(range(page - 1, page + 2)) + ['...', total_pages]
         
     except Exception as e:
-        print(f"Error fetching reports data: {str(e)}")
+        logger.exception("Error fetching reports data")
         departments = []
         programs = []
         types = []
@@ -965,27 +1426,64 @@ def reports_view(request):
     return render(request, 'dashboard/reports.html', context)
 
 
+def _run_report_job(report_id, report_type, report_format, department_id, program_id, type_id, date_from, date_to, user):
+    """
+    Background body of generate_report: build the file, upload it, then mark
+    the reports_history record completed (or failed).
+
+    Runs on a daemon thread so rendering and the Cloudinary upload never hold
+    a request worker. A throwaway SimpleNamespace stands in for the request
+    object purely as the per-job collection memo.
+    """
+    try:
+        from .cloudinary_utils import upload_file_to_cloudinary
+
+        job_context = SimpleNamespace()
+
+        if report_format == 'pdf':
+            file_data = generate_pdf_report(report_type, department_id, program_id, type_id, date_from, date_to, user, request=job_context)
+            file_extension = 'pdf'
+        else:
+            file_data = generate_excel_report(report_type, department_id, program_id, type_id, date_from, date_to, user, request=job_context)
+            file_extension = 'xlsx'
+
+        filename = f"{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_extension}"
+
+        # Both generators return a rewound BytesIO buffer; measure the size
+        # without copying and hand it straight to the uploader
+        file_size = file_data.getbuffer().nbytes if hasattr(file_data, 'getbuffer') else len(file_data)
+        cloudinary_url = upload_file_to_cloudinary(file_data, filename, folder='reports')
+
+        update_document('reports_history', report_id, {
+            'status': 'completed',
+            'file_size': file_size,
+            'file_url': cloudinary_url,
+            'file_path': cloudinary_url,
+        })
+    except Exception as e:
+        logger.exception("Error running report job %s", report_id)
+        try:
+            update_document('reports_history', report_id, {
+                'status': 'failed',
+                'error': str(e),
+            })
+        except Exception:
+            pass
+
+
 @login_required
 def generate_report(request):
-    """Generate report based on filters and type"""
+    """Queue report generation and return a job id the client can poll"""
     if request.method != 'POST':
         return JsonResponse({'success': False, 'message': 'Invalid request method'})
-    
+
     try:
         import json
         from datetime import datetime
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-        import io
-        from .cloudinary_utils import upload_file_to_cloudinary
-        
+
         user = get_user_from_session(request)
         data = json.loads(request.body)
-        
+
         report_type = data.get('report_type')
         report_format = data.get('format', 'pdf')
         department_id = data.get('department_id', '')
@@ -993,63 +1491,48 @@ def generate_report(request):
         type_id = data.get('type_id', '')
         date_from = data.get('date_from', '')
         date_to = data.get('date_to', '')
-        
-        # Build scope description
+
+        if report_format not in ('pdf', 'excel'):
+            return JsonResponse({'success': False, 'message': 'Invalid format'})
+
+        # Build scope description - fan out the selected lookups in parallel
+        # instead of up to three serial round-trips
         scope_parts = []
-        if department_id:
-            dept = get_document('departments', department_id)
-            if dept:
-                scope_parts.append(f"Department: {dept.get('name')}")
-        if program_id:
-            prog = get_document('programs', program_id)
-            if prog:
-                scope_parts.append(f"Program: {prog.get('name')}")
-        if type_id:
-            accred_type = get_document('accreditation_types', type_id)
-            if accred_type:
-                scope_parts.append(f"Type: {accred_type.get('name')}")
+        dept = prog = accred_type = None
+        if department_id or program_id or type_id:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                dept, prog, accred_type = executor.map(
+                    lambda args: get_document(*args) if args[1] else None,
+                    [
+                        ('departments', department_id),
+                        ('programs', program_id),
+                        ('accreditation_types', type_id),
+                    ]
+                )
+        if dept:
+            scope_parts.append(f"Department: {dept.get('name')}")
+        if prog:
+            scope_parts.append(f"Program: {prog.get('name')}")
+        if accred_type:
+            scope_parts.append(f"Type: {accred_type.get('name')}")
         if date_from and date_to:
             scope_parts.append(f"Period: {date_from} to {date_to}")
-        
+
         scope = " | ".join(scope_parts) if scope_parts else "All Data"
-        
-        # Generate report based on format
-        if report_format == 'pdf':
-            file_data = generate_pdf_report(report_type, department_id, program_id, type_id, date_from, date_to, user)
-            file_extension = 'pdf'
-            content_type = 'application/pdf'
-        elif report_format == 'excel':
-            file_data = generate_excel_report(report_type, department_id, program_id, type_id, date_from, date_to, user)
-            file_extension = 'xlsx'
-            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        else:
-            return JsonResponse({'success': False, 'message': 'Invalid format'})
-        
-        # Upload to Cloudinary
+
+        file_extension = 'pdf' if report_format == 'pdf' else 'xlsx'
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{report_type}_{timestamp}.{file_extension}"
-        
-        cloudinary_url = upload_file_to_cloudinary(file_data, filename, folder='reports')
-        
-        # Get user details from users collection
+
+        # Resolve the generator's display name from the cached map
         user_email = user.get('email', 'Unknown')
-        user_name = 'Unknown User'
         try:
-            # Try to get user from users collection
-            users = get_all_documents('users')
-            user_doc = next((u for u in users if u.get('email') == user_email), None)
-            if user_doc:
-                first_name = user_doc.get('first_name', '')
-                last_name = user_doc.get('last_name', '')
-                user_name = f"{first_name} {last_name}".strip() or user_email
-            else:
-                # Fallback to user object if not found
-                user_name = user.get('displayName', user.get('name', user_email))
+            user_name = get_user_name_map().get(user_email) or user.get('displayName', user.get('name', user_email))
         except Exception as e:
-            print(f"Error fetching user details: {e}")
+            logger.exception("Error fetching user details")
             user_name = user.get('displayName', user.get('name', user_email))
-        
-        # Save to reports history
+
+        # Create the history record up front as the job record; the background
+        # thread flips it to completed/failed when rendering finishes
         report_data = {
             'id': f"report_{timestamp}_{user.get('uid', 'unknown')}",
             'type': report_type,
@@ -1058,78 +1541,191 @@ def generate_report(request):
             'scope': scope,
             'created_at': datetime.now().isoformat(),
             'format': file_extension.upper(),
-            'status': 'completed',
-            'file_size': len(file_data),
-            'file_url': cloudinary_url,
-            'file_path': cloudinary_url,
+            'status': 'processing',
+            'file_size': 0,
+            'file_url': '',
+            'file_path': '',
+        }
+
+        create_document('reports_history', report_data, report_data['id'])
+        try:
+            report_desc = f"{report_type.replace('_', ' ').title()} ({file_extension.upper()})"
+            scope_desc = f" - {scope}" if scope != 'all' else ""
+            log_audit(user, action_type='report_generation', resource_type='report', resource_id=report_data['id'], details=f"Generated report: {report_desc}{scope_desc}", status='success', ip=get_client_ip(request))
+        except Exception:
+            pass
+
+        # Render and upload off the request thread
+        threading.Thread(
+            target=_run_report_job,
+            args=(report_data['id'], report_type, report_format, department_id, program_id, type_id, date_from, date_to, user),
+            daemon=True
+        ).start()
+
+        return JsonResponse({
+            'success': True,
+            'message': 'Report generation started',
+            'report_id': report_data['id'],
+            'job_id': report_data['id'],
+            'status': 'processing'
+        })
+
+    except Exception as e:
+        logger.exception("Error generating report")
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+@login_required
+def report_status(request, report_id):
+    """Poll endpoint for a queued report job"""
+    try:
+        report = get_document('reports_history', report_id)
+        if not report:
+            return JsonResponse({'success': False, 'message': 'Report not found'})
+
+        return JsonResponse({
+            'success': True,
+            'status': report.get('status', 'processing'),
+            'download_url': report.get('file_url', ''),
+            'message': report.get('error', '')
+        })
+    except Exception as e:
+        logger.exception("Error fetching report status")
+        return JsonResponse({'success': False, 'message': str(e)})
+
+
+_pdf_styles = None
+
+
+def get_pdf_styles():
+    """
+    Build the shared ReportLab style objects once per process.
+
+    The report styles are fixed constants, so the sample stylesheet, the
+    custom paragraph styles and the TableStyle command lists are cached at
+    module scope instead of being rebuilt for every report. ReportLab stays
+    a lazy import so it only loads when a PDF is actually generated.
+
+    Returns:
+        dict: Named style objects shared by the PDF generators
+    """
+    global _pdf_styles
+    if _pdf_styles is None:
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import TableStyle
+        from reportlab.lib.enums import TA_CENTER
+
+        styles = getSampleStyleSheet()
+        _pdf_styles = {
+            'sheet': styles,
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                textColor=colors.HexColor('#2c3e50'),
+                spaceAfter=30,
+                alignment=TA_CENTER,
+                fontName='Helvetica-Bold'
+            ),
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=16,
+                textColor=colors.HexColor('#4CAF50'),
+                spaceAfter=12,
+                spaceBefore=12,
+                fontName='Helvetica-Bold'
+            ),
+            # Two-column metric tables (summary sections)
+            'summary_table': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 10),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+            ]),
+            'summary_table_small': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 11),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 10),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+            ]),
+            # Single-row department banner
+            'dept_header_table': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#E8F5E9')),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2E7D32')),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 12),
+                ('TOPPADDING', (0, 0), (-1, -1), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+                ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ]),
+            # Centered data grids (programs / performance tables)
+            'data_table': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 9),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+            ]),
+            # Denser grid for the wide results table
+            'data_table_dense': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 9),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+            ]),
         }
-        
-        create_document('reports_history', report_data, report_data['id'])
-        try:
-            report_desc = f"{report_type.replace('_', ' ').title()} ({file_extension.upper()})"
-            scope_desc = f" - {scope}" if scope != 'all' else ""
-            log_audit(user, action_type='report_generation', resource_type='report', resource_id=report_data['id'], details=f"Generated report: {report_desc}{scope_desc}", status='success', ip=get_client_ip(request))
-        except Exception:
-            pass
-        
-        return JsonResponse({
-            'success': True,
-            'message': 'Report generated successfully',
-            'report_id': report_data['id'],
-            'download_url': cloudinary_url
-        })
-        
-    except Exception as e:
-        print(f"Error generating report: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({'success': False, 'message': str(e)})
+    return _pdf_styles
 
 
-def generate_pdf_report(report_type, department_id, program_id, type_id, date_from, date_to, user):
+def generate_pdf_report(report_type, department_id, program_id, type_id, date_from, date_to, user, request=None):
     """Generate PDF report"""
-    from reportlab.lib import colors
     from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
     from datetime import datetime
     import io
-    
+
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#4CAF50'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
+    pdf_styles = get_pdf_styles()
+    styles = pdf_styles['sheet']
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
+
     # Header
     story.append(Paragraph("PLP Accreditation System", title_style))
-    report_title = {
-        'complete_accreditation': 'Complete Accreditation Report',
-        'results_incentives': 'Results and Incentives Report',
-        'performance_analytics': 'Performance Analytics Report'
-    }.get(report_type, 'System Report')
+    report_title = _REPORT_TITLES.get(report_type, 'System Report')
     
     story.append(Paragraph(report_title, heading_style))
     story.append(Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", styles['Normal']))
@@ -1138,33 +1734,39 @@ def generate_pdf_report(report_type, department_id, program_id, type_id, date_fr
     
     # Fetch data based on report type
     if report_type == 'complete_accreditation':
-        story.extend(generate_complete_accreditation_content(department_id, program_id, type_id, styles, heading_style))
+        story.extend(generate_complete_accreditation_content(department_id, program_id, type_id, styles, heading_style, request=request))
     elif report_type == 'results_incentives':
-        story.extend(generate_results_incentives_content(department_id, program_id, type_id, styles, heading_style))
+        story.extend(generate_results_incentives_content(department_id, program_id, type_id, styles, heading_style, request=request))
     elif report_type == 'performance_analytics':
-        story.extend(generate_performance_analytics_content(department_id, program_id, type_id, styles, heading_style))
+        story.extend(generate_performance_analytics_content(department_id, program_id, type_id, styles, heading_style, request=request))
     
     doc.build(story)
+    # Return the rewound buffer itself instead of copying it out with getvalue();
+    # the Cloudinary uploader accepts file-like objects directly
     buffer.seek(0)
-    return buffer.getvalue()
+    return buffer
 
 
-def generate_complete_accreditation_content(department_id, program_id, type_id, styles, heading_style):
+def generate_complete_accreditation_content(department_id, program_id, type_id, styles, heading_style, request=None):
     """Generate content for complete accreditation report"""
-    from reportlab.lib import colors
-    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import Table, Paragraph, Spacer
     from reportlab.lib.units import inch
     
     content = []
     content.append(Paragraph("Executive Summary", heading_style))
-    
-    # Fetch all data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
+
+    # Fetch all data (six independent RPCs, issued concurrently)
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types', 'areas'],
+        ['checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
     
     # Filter by selections
     if department_id:
@@ -1174,16 +1776,17 @@ def generate_complete_accreditation_content(department_id, program_id, type_id,
     if type_id:
         types = [t for t in types if t.get('id') == type_id]
     
-    departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-    programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
-    types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
-    areas = [a for a in areas if a.get('is_active', True) and not a.get('is_archived', False)]
     
-    # Summary statistics
+    # Summary statistics - count required/approved documents in one pass
     total_areas = len(areas)
     total_checklists = len(checklists)
-    total_docs = len([d for d in documents if d.get('is_required', False)])
-    approved_docs = len([d for d in documents if d.get('is_required', False) and d.get('status') == 'approved'])
+    total_docs = 0
+    approved_docs = 0
+    for d in documents:
+        if d.get('is_required', False):
+            total_docs += 1
+            if d.get('status') == 'approved':
+                approved_docs += 1
     
     summary_data = [
         ['Metric', 'Count'],
@@ -1194,45 +1797,33 @@ def generate_complete_accreditation_content(department_id, program_id, type_id,
         ['Checklists', str(total_checklists)],
         ['Required Documents', str(total_docs)],
         ['Approved Documents', str(approved_docs)],
-        ['Overall Progress', f"{round((approved_docs/total_docs*100) if total_docs > 0 else 0, 1)}%"],
+        ['Overall Progress', f"{progress_pct(approved_docs, total_docs)}%"],
     ]
     
     summary_table = Table(summary_data, colWidths=[4*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-    ]))
+    summary_table.setStyle(get_pdf_styles()['summary_table'])
     
     content.append(summary_table)
     content.append(Spacer(1, 0.3*inch))
     
+    # Index the hierarchy once so the loops below are O(1) per lookup
+    programs_by_dept, types_by_program, areas_by_type, checklists_by_area = build_relation_indexes(
+        programs, types, areas, checklists
+    )
+    approved_checklist_ids = {
+        d.get('checklist_id') for d in documents
+        if d.get('is_required', False) and d.get('status') == 'approved'
+    }
+
     # Department details
     content.append(Paragraph("Department Details", heading_style))
-    
+
     for dept in departments:
-        dept_programs = [p for p in programs if p.get('department_id') == dept.get('id')]
-        
+        dept_programs = programs_by_dept.get(dept.get('id'), [])
+
         dept_data = [[f"{dept.get('name')} ({dept.get('code')})"]]
         dept_table = Table(dept_data, colWidths=[6*inch])
-        dept_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#E8F5E9')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2E7D32')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        dept_table.setStyle(get_pdf_styles()['dept_header_table'])
         content.append(dept_table)
         content.append(Spacer(1, 0.1*inch))
         
@@ -1241,46 +1832,32 @@ def generate_complete_accreditation_content(department_id, program_id, type_id,
             prog_data = [['Program Code', 'Program Name', 'Types', 'Areas', 'Progress']]
             
             for prog in dept_programs:
-                prog_types = [t for t in types if t.get('program_id') == prog.get('id')]
-                prog_areas = []
-                for t in prog_types:
-                    prog_areas.extend([a for a in areas if a.get('type_id') == t.get('id') or a.get('accreditation_type_id') == t.get('id')])
-                
-                # Calculate progress
-                prog_checklists = []
-                for area in prog_areas:
-                    prog_checklists.extend([c for c in checklists if c.get('area_id') == area.get('id')])
-                
+                prog_types = types_by_program.get(prog.get('id'), [])
+
+                # Walk the index lazily; only counts are needed so the
+                # intermediate area/checklist lists never get materialized
+                area_count = 0
+                total = 0
                 completed = 0
-                for checklist in prog_checklists:
-                    req_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False) and d.get('status') == 'approved']
-                    if len(req_docs) > 0:
-                        completed += 1
-                
-                progress = round((completed / len(prog_checklists) * 100) if len(prog_checklists) > 0 else 0, 1)
-                
+                for area in chain.from_iterable(areas_by_type.get(t.get('id'), []) for t in prog_types):
+                    area_count += 1
+                    for c in checklists_by_area.get(area.get('id'), []):
+                        total += 1
+                        if c.get('id') in approved_checklist_ids:
+                            completed += 1
+
+                progress = progress_pct(completed, total)
+
                 prog_data.append([
                     prog.get('code', ''),
                     prog.get('name', ''),
                     str(len(prog_types)),
-                    str(len(prog_areas)),
+                    str(area_count),
                     f"{progress}%"
                 ])
             
             prog_table = Table(prog_data, colWidths=[1*inch, 2.5*inch, 0.8*inch, 0.8*inch, 0.9*inch])
-            prog_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-            ]))
+            prog_table.setStyle(get_pdf_styles()['data_table'])
             content.append(prog_table)
         
         content.append(Spacer(1, 0.2*inch))
@@ -1288,22 +1865,26 @@ def generate_complete_accreditation_content(department_id, program_id, type_id,
     return content
 
 
-def generate_results_incentives_content(department_id, program_id, type_id, styles, heading_style):
+def generate_results_incentives_content(department_id, program_id, type_id, styles, heading_style, request=None):
     """Generate content for results and incentives report"""
-    from reportlab.lib import colors
-    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import Table, Paragraph, Spacer
     from reportlab.lib.units import inch
     
     content = []
     content.append(Paragraph("Results and Incentives Overview", heading_style))
-    
-    # Fetch all data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
+
+    # Fetch all data (six independent RPCs, issued concurrently)
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types', 'areas'],
+        ['checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
     
     # Filter by selections
     if department_id:
@@ -1313,41 +1894,43 @@ def generate_results_incentives_content(department_id, program_id, type_id, styl
     if type_id:
         types = [t for t in types if t.get('id') == type_id]
     
-    departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-    programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
-    types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
-    areas = [a for a in areas if a.get('is_active', True) and not a.get('is_archived', False)]
     
+    # Index checklists and completed-checklist ids once instead of rescanning
+    # the full collections per area
+    checklists_by_area = {}
+    for checklist in checklists:
+        checklists_by_area.setdefault(checklist.get('area_id'), []).append(checklist)
+    approved_checklist_ids = {
+        d.get('checklist_id') for d in documents
+        if d.get('is_required', False) and d.get('status') == 'approved'
+    }
+
+    # Id lookups for the per-area ancestor resolution below
+    types_by_id = {t.get('id'): t for t in types}
+    programs_by_id = {p.get('id'): p for p in programs}
+    departments_by_id = {d.get('id'): d for d in departments}
+
     # Build results data
     results_data = [['Department', 'Program', 'Type', 'Area', 'Progress', 'Certificate', 'Incentive']]
-    
+
     for area in areas:
         type_id_val = area.get('type_id') or area.get('accreditation_type_id')
-        accred_type = next((t for t in types if t.get('id') == type_id_val), None)
+        accred_type = types_by_id.get(type_id_val)
         if not accred_type:
             continue
-        
-        prog_id = accred_type.get('program_id')
-        program = next((p for p in programs if p.get('id') == prog_id), None)
+
+        program = programs_by_id.get(accred_type.get('program_id'))
         if not program:
             continue
-        
-        dept_id = program.get('department_id')
-        department = next((d for d in departments if d.get('id') == dept_id), None)
+
+        department = departments_by_id.get(program.get('department_id'))
         if not department:
             continue
         
         # Calculate progress
-        area_checklists = [c for c in checklists if c.get('area_id') == area.get('id')]
-        if not area_checklists:
-            progress = 0
-        else:
-            completed = 0
-            for checklist in area_checklists:
-                req_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False) and d.get('status') == 'approved']
-                if len(req_docs) > 0:
-                    completed += 1
-            progress = round((completed / len(area_checklists) * 100) if len(area_checklists) > 0 else 0, 1)
+        area_checklists = checklists_by_area.get(area.get('id'), [])
+        completed = sum(1 for c in area_checklists if c.get('id') in approved_checklist_ids)
+        progress = progress_pct(completed, len(area_checklists))
         
         certificate = "Issued" if area.get('certificate_issued', False) else "Pending"
         incentive = "Eligible" if progress >= 80 else "Not Eligible"
@@ -1364,19 +1947,7 @@ def generate_results_incentives_content(department_id, program_id, type_id, styl
     
     if len(results_data) > 1:
         results_table = Table(results_data, colWidths=[0.8*inch, 0.8*inch, 1.2*inch, 1.5*inch, 0.7*inch, 0.8*inch, 0.9*inch])
-        results_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-        ]))
+        results_table.setStyle(get_pdf_styles()['data_table_dense'])
         content.append(results_table)
     else:
         content.append(Paragraph("No data available for selected filters.", styles['Normal']))
@@ -1396,40 +1967,32 @@ def generate_results_incentives_content(department_id, program_id, type_id, styl
     ]
     
     summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-    ]))
+    summary_table.setStyle(get_pdf_styles()['summary_table_small'])
     content.append(summary_table)
     
     return content
 
 
-def generate_performance_analytics_content(department_id, program_id, type_id, styles, heading_style):
+def generate_performance_analytics_content(department_id, program_id, type_id, styles, heading_style, request=None):
     """Generate content for performance analytics report"""
-    from reportlab.lib import colors
-    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import Table, Paragraph, Spacer
     from reportlab.lib.units import inch
     
     content = []
     content.append(Paragraph("Performance Analytics", heading_style))
-    
-    # Fetch all data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
+
+    # Fetch all data (six independent RPCs, issued concurrently)
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types'],
+        ['areas', 'checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
     
     # Filter by selections
     if department_id:
@@ -1439,62 +2002,42 @@ def generate_performance_analytics_content(department_id, program_id, type_id, s
     if type_id:
         types = [t for t in types if t.get('id') == type_id]
     
-    departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-    programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
-    types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
     
-    # Calculate department performance
+    # Per-checklist required/approved document counts in one pass
+    required_counts = {}
+    approved_counts = {}
+    for d in documents:
+        if d.get('is_required', False):
+            checklist_id = d.get('checklist_id')
+            required_counts[checklist_id] = required_counts.get(checklist_id, 0) + 1
+            if d.get('status') == 'approved':
+                approved_counts[checklist_id] = approved_counts.get(checklist_id, 0) + 1
+
+    # Calculate department performance via the shared hierarchy walk,
+    # keeping this report's active-only filter on areas
+    active_areas = [a for a in areas if a.get('is_active', True)]
+    dept_rows = compute_department_performance(
+        departments, programs, types, active_areas, checklists, approved_counts, required_counts
+    )
+
     dept_data = [['Rank', 'Department', 'Programs', 'Checklists', 'Documents', 'Progress', 'Status']]
     dept_performance = []
-    
-    for dept in departments:
-        dept_programs = [p for p in programs if p.get('department_id') == dept.get('id')]
-        dept_types = []
-        dept_areas = []
-        for prog in dept_programs:
-            prog_types = [t for t in types if t.get('program_id') == prog.get('id')]
-            dept_types.extend(prog_types)
-            for t in prog_types:
-                dept_areas.extend([a for a in areas if (a.get('type_id') == t.get('id') or a.get('accreditation_type_id') == t.get('id')) and a.get('is_active', True)])
-        
-        dept_checklists = []
-        for area in dept_areas:
-            dept_checklists.extend([c for c in checklists if c.get('area_id') == area.get('id')])
-        
-        completed_checklists = 0
-        required_docs = 0
-        approved_docs = 0
-        
-        for checklist in dept_checklists:
-            checklist_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False)]
-            required_docs += len(checklist_docs)
-            approved = [d for d in checklist_docs if d.get('status') == 'approved']
-            approved_docs += len(approved)
-            if len(approved) > 0:
-                completed_checklists += 1
-        
-        progress = round((approved_docs / required_docs * 100) if required_docs > 0 else 0, 1)
-        
-        if progress >= 80:
-            status = "Excellent"
-        elif progress >= 60:
-            status = "Good"
-        elif progress >= 40:
-            status = "Needs Work"
-        else:
-            status = "Critical"
-        
+
+    for row in dept_rows:
+        progress = progress_pct(row['approved_docs'], row['required_docs'])
+        status = performance_status(progress)
+
         dept_performance.append({
-            'name': dept.get('name', ''),
-            'programs': len(dept_programs),
-            'checklists': f"{completed_checklists}/{len(dept_checklists)}",
-            'documents': f"{approved_docs}/{required_docs}",
+            'name': row['dept'].get('name', ''),
+            'programs': row['programs_count'],
+            'checklists': f"{row['completed_checklists']}/{row['checklists_count']}",
+            'documents': f"{row['approved_docs']}/{row['required_docs']}",
             'progress': progress,
             'status': status
         })
     
     # Sort by progress
-    dept_performance.sort(key=lambda x: x['progress'], reverse=True)
+    dept_performance.sort(key=itemgetter('progress'), reverse=True)
     
     for idx, dept in enumerate(dept_performance, 1):
         dept_data.append([
@@ -1509,19 +2052,7 @@ def generate_performance_analytics_content(department_id, program_id, type_id, s
     
     if len(dept_data) > 1:
         perf_table = Table(dept_data, colWidths=[0.5*inch, 2*inch, 0.8*inch, 1*inch, 1*inch, 0.8*inch, 1*inch])
-        perf_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-        ]))
+        perf_table.setStyle(get_pdf_styles()['data_table'])
         content.append(perf_table)
     else:
         content.append(Paragraph("No data available for selected filters.", styles['Normal']))
@@ -1546,52 +2077,82 @@ def generate_performance_analytics_content(department_id, program_id, type_id, s
         ]
         
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ]))
+        summary_table.setStyle(get_pdf_styles()['summary_table_small'])
         content.append(summary_table)
     
     return content
 
 
-def generate_excel_report(report_type, department_id, program_id, type_id, date_from, date_to, user):
+_excel_styles = None
+
+
+def get_excel_styles():
+    """
+    Build the shared openpyxl style objects once per process.
+
+    openpyxl style objects are immutable and safely shared between cells,
+    so the fonts, fills, alignments and border used by every Excel report
+    are created once instead of per call (previously the centered header
+    alignment was even rebuilt per header cell). openpyxl stays a lazy
+    import so it only loads when an Excel report is generated.
+
+    Returns:
+        dict: Named style objects shared by the Excel generators
+    """
+    global _excel_styles
+    if _excel_styles is None:
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+
+        side = Side(style='thin', color='CCCCCC')
+        _excel_styles = {
+            'header_font': Font(name='Arial', size=14, bold=True, color='FFFFFF'),
+            'header_fill': PatternFill(start_color='4CAF50', end_color='4CAF50', fill_type='solid'),
+            'header_alignment': Alignment(horizontal='center', vertical='center'),
+            'title_font': Font(name='Arial', size=12, bold=True),
+            'title_alignment': Alignment(horizontal='center'),
+            'table_header_font': Font(name='Arial', size=11, bold=True, color='FFFFFF'),
+            'cell_alignment': Alignment(horizontal='left', vertical='center'),
+            'border': Border(left=side, right=side, top=side, bottom=side),
+        }
+    return _excel_styles
+
+
+def generate_excel_report(report_type, department_id, program_id, type_id, date_from, date_to, user, request=None):
     """Generate Excel report"""
     from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
     from openpyxl.utils import get_column_letter
     from datetime import datetime
     import io
-    
+
     wb = Workbook()
     ws = wb.active
     ws.title = "Report"
-    
-    # Header styling
-    header_font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='4CAF50', end_color='4CAF50', fill_type='solid')
-    header_alignment = Alignment(horizontal='center', vertical='center')
-    
-    table_header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-    table_header_fill = PatternFill(start_color='4CAF50', end_color='4CAF50', fill_type='solid')
-    
-    cell_alignment = Alignment(horizontal='left', vertical='center')
-    border = Border(
-        left=Side(style='thin', color='CCCCCC'),
-        right=Side(style='thin', color='CCCCCC'),
-        top=Side(style='thin', color='CCCCCC'),
-        bottom=Side(style='thin', color='CCCCCC')
-    )
-    
+
+    # Header styling (shared immutable style objects)
+    styles = get_excel_styles()
+    header_font = styles['header_font']
+    header_fill = styles['header_fill']
+    header_alignment = styles['header_alignment']
+
+    # Table cells are styled by name so every header/data cell shares a
+    # single registered style instead of per-cell font/fill/border entries.
+    # NamedStyle binds to its workbook, so build fresh ones per report
+    # (reports can generate concurrently in background threads) from the
+    # shared immutable parts.
+    from openpyxl.styles import NamedStyle
+    wb.add_named_style(NamedStyle(
+        name='report_table_header',
+        font=styles['table_header_font'],
+        fill=styles['header_fill'],
+        alignment=styles['header_alignment'],
+        border=styles['border'],
+    ))
+    wb.add_named_style(NamedStyle(
+        name='report_body',
+        alignment=styles['cell_alignment'],
+        border=styles['border'],
+    ))
+
     # Title
     ws.merge_cells('A1:G1')
     ws['A1'] = 'PLP Accreditation System'
@@ -1599,62 +2160,80 @@ def generate_excel_report(report_type, department_id, program_id, type_id, date_
     ws['A1'].fill = header_fill
     ws['A1'].alignment = header_alignment
     ws.row_dimensions[1].height = 25
-    
+
     # Report type
     ws.merge_cells('A2:G2')
-    report_title = {
-        'complete_accreditation': 'Complete Accreditation Report',
-        'results_incentives': 'Results and Incentives Report',
-        'performance_analytics': 'Performance Analytics Report'
-    }.get(report_type, 'System Report')
+    report_title = _REPORT_TITLES.get(report_type, 'System Report')
     ws['A2'] = report_title
-    ws['A2'].font = Font(name='Arial', size=12, bold=True)
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].font = styles['title_font']
+    ws['A2'].alignment = styles['title_alignment']
     
     # Metadata
-    ws['A3'] = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
-    ws['A4'] = f"Generated by: {user.get('displayName', 'Unknown User')}"
-    
+    generated_line = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
+    generated_by_line = f"Generated by: {user.get('displayName', 'Unknown User')}"
+    ws['A3'] = generated_line
+    ws['A4'] = generated_by_line
+
+    # Blank spacer row, emitted so the append()-based writers below continue
+    # at row 6
+    ws.append(())
     current_row = 6
-    
+
+    # Track the widest value per column while rows are written instead of
+    # re-walking every cell through ws.columns afterwards
+    col_widths = [0] * 7
+    for value in ('PLP Accreditation System', report_title, generated_line, generated_by_line):
+        col_widths[0] = max(col_widths[0], len(value))
+
     # Fetch data based on report type
     if report_type == 'complete_accreditation':
-        current_row = generate_excel_complete_accreditation(ws, department_id, program_id, type_id, current_row, table_header_font, table_header_fill, cell_alignment, border)
+        current_row = generate_excel_complete_accreditation(ws, department_id, program_id, type_id, current_row, col_widths, request=request)
     elif report_type == 'results_incentives':
-        current_row = generate_excel_results_incentives(ws, department_id, program_id, type_id, current_row, table_header_font, table_header_fill, cell_alignment, border)
+        current_row = generate_excel_results_incentives(ws, department_id, program_id, type_id, current_row, col_widths, request=request)
     elif report_type == 'performance_analytics':
-        current_row = generate_excel_performance_analytics(ws, department_id, program_id, type_id, current_row, table_header_font, table_header_fill, cell_alignment, border)
-    
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+        current_row = generate_excel_performance_analytics(ws, department_id, program_id, type_id, current_row, col_widths, request=request)
+
+    # Auto-adjust column widths from the tracked maxima
+    for idx, width in enumerate(col_widths, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, 50)
     
     buffer = io.BytesIO()
     wb.save(buffer)
+    # Return the rewound buffer itself instead of copying it out with getvalue();
+    # the Cloudinary uploader accepts file-like objects directly
     buffer.seek(0)
-    return buffer.getvalue()
+    return buffer
+
+
+def write_excel_header(ws, row, headers, col_widths):
+    """
+    Append the table header row and style it via the shared named style.
+
+    append() writes at the worksheet's next row, so callers must have
+    positioned the sheet at row - 1 (generate_excel_report emits the blank
+    spacer row explicitly for this reason).
+    """
+    ws.append(headers)
+    for col, cell in enumerate(ws[row], 1):
+        cell.style = 'report_table_header'
+        col_widths[col - 1] = max(col_widths[col - 1], len(headers[col - 1]))
 
 
-def generate_excel_complete_accreditation(ws, department_id, program_id, type_id, start_row, header_font, header_fill, cell_alignment, border):
+def generate_excel_complete_accreditation(ws, department_id, program_id, type_id, start_row, col_widths, request=None):
     """Generate Excel content for complete accreditation report"""
-    from openpyxl.styles import Alignment
-    
-    # Fetch data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
+    # Fetch data (six independent RPCs, issued concurrently and memoized);
+    # the is_active/is_archived predicates run server-side in Firestore
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types', 'areas'],
+        ['checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
     
     # Filter
     if department_id:
@@ -1664,39 +2243,35 @@ def generate_excel_complete_accreditation(ws, department_id, program_id, type_id
     if type_id:
         types = [t for t in types if t.get('id') == type_id]
     
-    departments = [d for d in departments if d.get('is_active', True)]
-    programs = [p for p in programs if p.get('is_active', True)]
-    types = [t for t in types if t.get('is_active', True)]
-    areas = [a for a in areas if a.get('is_active', True)]
-    
     # Headers
     headers = ['Department', 'Program Code', 'Program Name', 'Type', 'Area', 'Checklists', 'Progress']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=start_row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
+    write_excel_header(ws, start_row, headers, col_widths)
     
     current_row = start_row + 1
-    
+
+    # Index the hierarchy once so the nested loops below are O(1) per lookup,
+    # and collect completed checklist ids in a single pass over documents
+    programs_by_dept, types_by_program, areas_by_type, checklists_by_area = build_relation_indexes(
+        programs, types, areas, checklists
+    )
+    approved_checklist_ids = {
+        d.get('checklist_id') for d in documents
+        if d.get('is_required', False) and d.get('status') == 'approved'
+    }
+
     # Data rows
     for dept in departments:
-        dept_programs = [p for p in programs if p.get('department_id') == dept.get('id')]
+        dept_programs = programs_by_dept.get(dept.get('id'), [])
         for prog in dept_programs:
-            prog_types = [t for t in types if t.get('program_id') == prog.get('id')]
+            prog_types = types_by_program.get(prog.get('id'), [])
             for ptype in prog_types:
-                type_areas = [a for a in areas if a.get('type_id') == ptype.get('id') or a.get('accreditation_type_id') == ptype.get('id')]
+                type_areas = areas_by_type.get(ptype.get('id'), [])
                 for area in type_areas:
-                    area_checklists = [c for c in checklists if c.get('area_id') == area.get('id')]
-                    
-                    completed = 0
-                    for checklist in area_checklists:
-                        req_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False) and d.get('status') == 'approved']
-                        if len(req_docs) > 0:
-                            completed += 1
-                    
-                    progress = round((completed / len(area_checklists) * 100) if len(area_checklists) > 0 else 0, 1)
+                    area_checklists = checklists_by_area.get(area.get('id'), [])
+
+                    completed = sum(1 for c in area_checklists if c.get('id') in approved_checklist_ids)
+
+                    progress = progress_pct(completed, len(area_checklists))
                     
                     row_data = [
                         dept.get('name', ''),
@@ -1708,115 +2283,74 @@ def generate_excel_complete_accreditation(ws, department_id, program_id, type_id
                         f"{progress}%"
                     ]
                     
-                    for col, value in enumerate(row_data, 1):
-                        cell = ws.cell(row=current_row, column=col, value=value)
-                        cell.alignment = cell_alignment
-                        cell.border = border
+                    # append() skips the per-cell coordinate lookup of ws.cell()
+                    ws.append(row_data)
+                    for col, cell in enumerate(ws[current_row], 1):
+                        cell.style = 'report_body'
+                        value_len = len(str(cell.value))
+                        if value_len > col_widths[col - 1]:
+                            col_widths[col - 1] = value_len
                     
                     current_row += 1
     
     return current_row + 2
 
 
-def generate_excel_results_incentives(ws, department_id, program_id, type_id, start_row, header_font, header_fill, cell_alignment, border):
+def generate_excel_results_incentives(ws, department_id, program_id, type_id, start_row, col_widths, request=None):
     """Generate Excel content for results and incentives report"""
-    from openpyxl.styles import Alignment
-    
-    # Fetch data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
-    
-    # Filter
-    if department_id:
-        departments = [d for d in departments if d.get('id') == department_id]
-    if program_id:
-        programs = [p for p in programs if p.get('id') == program_id]
-    if type_id:
-        types = [t for t in types if t.get('id') == type_id]
-    
-    departments = [d for d in departments if d.get('is_active', True)]
-    programs = [p for p in programs if p.get('is_active', True)]
-    types = [t for t in types if t.get('is_active', True)]
-    areas = [a for a in areas if a.get('is_active', True)]
-    
     # Headers
     headers = ['Department', 'Program', 'Type', 'Area', 'Progress', 'Certificate', 'Incentive Eligible']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=start_row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
+    write_excel_header(ws, start_row, headers, col_widths)
     
     current_row = start_row + 1
-    
-    # Data rows
-    for area in areas:
-        type_id_val = area.get('type_id') or area.get('accreditation_type_id')
-        accred_type = next((t for t in types if t.get('id') == type_id_val), None)
-        if not accred_type:
-            continue
-        
-        prog_id = accred_type.get('program_id')
-        program = next((p for p in programs if p.get('id') == prog_id), None)
-        if not program:
-            continue
-        
-        dept_id = program.get('department_id')
-        department = next((d for d in departments if d.get('id') == dept_id), None)
-        if not department:
-            continue
-        
-        # Calculate progress
-        area_checklists = [c for c in checklists if c.get('area_id') == area.get('id')]
-        if not area_checklists:
-            progress = 0
-        else:
-            completed = 0
-            for checklist in area_checklists:
-                req_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False) and d.get('status') == 'approved']
-                if len(req_docs) > 0:
-                    completed += 1
-            progress = round((completed / len(area_checklists) * 100) if len(area_checklists) > 0 else 0, 1)
-        
+
+    # Data rows from the per-area records shared with results_view
+    for row in build_results_rows(department_id, program_id, type_id, request=request):
+        area = row['area']
+        progress = progress_pct(row['completed_checklists'], row['total_checklists'])
+
         certificate = "Issued" if area.get('certificate_issued', False) else "Pending"
         incentive = "Yes" if progress >= 80 else "No"
         
         row_data = [
-            department.get('code', ''),
-            program.get('code', ''),
-            accred_type.get('name', ''),
+            row['department'].get('code', ''),
+            row['program'].get('code', ''),
+            row['type'].get('name', ''),
             area.get('name', ''),
             f"{progress}%",
             certificate,
             incentive
         ]
         
-        for col, value in enumerate(row_data, 1):
-            cell = ws.cell(row=current_row, column=col, value=value)
-            cell.alignment = cell_alignment
-            cell.border = border
+        # append() skips the per-cell coordinate lookup of ws.cell()
+        ws.append(row_data)
+        for col, cell in enumerate(ws[current_row], 1):
+            cell.style = 'report_body'
+            value_len = len(str(cell.value))
+            if value_len > col_widths[col - 1]:
+                col_widths[col - 1] = value_len
         
         current_row += 1
     
     return current_row + 2
 
 
-def generate_excel_performance_analytics(ws, department_id, program_id, type_id, start_row, header_font, header_fill, cell_alignment, border):
+def generate_excel_performance_analytics(ws, department_id, program_id, type_id, start_row, col_widths, request=None):
     """Generate Excel content for performance analytics report"""
-    from openpyxl.styles import Alignment
-    
-    # Fetch data
-    departments = get_all_documents('departments')
-    programs = get_all_documents('programs')
-    types = get_all_documents('accreditation_types')
-    areas = get_all_documents('areas')
-    checklists = get_all_documents('checklists')
-    documents = get_all_documents('documents')
+    # Fetch data (six independent RPCs, issued concurrently and memoized);
+    # areas stay in the all-documents group so this report matches the PDF
+    # analytics path, which filters areas on is_active only
+    collections = fetch_collections_parallel(
+        ['departments', 'programs', 'accreditation_types'],
+        ['areas', 'checklists', 'documents'],
+        request=request
+    )
+    departments = collections['departments']
+    programs = collections['programs']
+    types = collections['accreditation_types']
+    areas = collections['areas']
+    checklists = collections['checklists']
+    documents = collections['documents']
     
     # Filter
     if department_id:
@@ -1826,69 +2360,43 @@ def generate_excel_performance_analytics(ws, department_id, program_id, type_id,
     if type_id:
         types = [t for t in types if t.get('id') == type_id]
     
-    departments = [d for d in departments if d.get('is_active', True)]
-    programs = [p for p in programs if p.get('is_active', True)]
-    types = [t for t in types if t.get('is_active', True)]
-    
     # Headers
     headers = ['Rank', 'Department', 'Programs', 'Checklists', 'Documents', 'Progress', 'Status']
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=start_row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
-    
-    # Calculate performance
+    write_excel_header(ws, start_row, headers, col_widths)
+    
+    # Per-checklist required/approved document counts in one pass
+    required_counts = {}
+    approved_counts = {}
+    for d in documents:
+        if d.get('is_required', False):
+            checklist_id = d.get('checklist_id')
+            required_counts[checklist_id] = required_counts.get(checklist_id, 0) + 1
+            if d.get('status') == 'approved':
+                approved_counts[checklist_id] = approved_counts.get(checklist_id, 0) + 1
+
+    # Calculate department performance via the shared hierarchy walk,
+    # keeping this report's active-only filter on areas
+    active_areas = [a for a in areas if a.get('is_active', True)]
+    dept_rows = compute_department_performance(
+        departments, programs, types, active_areas, checklists, approved_counts, required_counts
+    )
+
     dept_performance = []
-    for dept in departments:
-        dept_programs = [p for p in programs if p.get('department_id') == dept.get('id')]
-        dept_types = []
-        dept_areas = []
-        for prog in dept_programs:
-            prog_types = [t for t in types if t.get('program_id') == prog.get('id')]
-            dept_types.extend(prog_types)
-            for t in prog_types:
-                dept_areas.extend([a for a in areas if (a.get('type_id') == t.get('id') or a.get('accreditation_type_id') == t.get('id')) and a.get('is_active', True)])
-        
-        dept_checklists = []
-        for area in dept_areas:
-            dept_checklists.extend([c for c in checklists if c.get('area_id') == area.get('id')])
-        
-        completed_checklists = 0
-        required_docs = 0
-        approved_docs = 0
-        
-        for checklist in dept_checklists:
-            checklist_docs = [d for d in documents if d.get('checklist_id') == checklist.get('id') and d.get('is_required', False)]
-            required_docs += len(checklist_docs)
-            approved = [d for d in checklist_docs if d.get('status') == 'approved']
-            approved_docs += len(approved)
-            if len(approved) > 0:
-                completed_checklists += 1
-        
-        progress = round((approved_docs / required_docs * 100) if required_docs > 0 else 0, 1)
-        
-        if progress >= 80:
-            status = "Excellent"
-        elif progress >= 60:
-            status = "Good"
-        elif progress >= 40:
-            status = "Needs Work"
-        else:
-            status = "Critical"
-        
+    for row in dept_rows:
+        progress = progress_pct(row['approved_docs'], row['required_docs'])
+        status = performance_status(progress)
+
         dept_performance.append({
-            'name': dept.get('name', ''),
-            'programs': len(dept_programs),
-            'checklists': f"{completed_checklists}/{len(dept_checklists)}",
-            'documents': f"{approved_docs}/{required_docs}",
+            'name': row['dept'].get('name', ''),
+            'programs': row['programs_count'],
+            'checklists': f"{row['completed_checklists']}/{row['checklists_count']}",
+            'documents': f"{row['approved_docs']}/{row['required_docs']}",
             'progress': progress,
             'status': status
         })
     
     # Sort by progress
-    dept_performance.sort(key=lambda x: x['progress'], reverse=True)
+    dept_performance.sort(key=itemgetter('progress'), reverse=True)
     
     current_row = start_row + 1
     for idx, dept in enumerate(dept_performance, 1):
@@ -1902,10 +2410,13 @@ def generate_excel_performance_analytics(ws, department_id, program_id, type_id,
             dept['status']
         ]
         
-        for col, value in enumerate(row_data, 1):
-            cell = ws.cell(row=current_row, column=col, value=value)
-            cell.alignment = cell_alignment
-            cell.border = border
+        # append() skips the per-cell coordinate lookup of ws.cell()
+        ws.append(row_data)
+        for col, cell in enumerate(ws[current_row], 1):
+            cell.style = 'report_body'
+            value_len = len(str(cell.value))
+            if value_len > col_widths[col - 1]:
+                col_widths[col - 1] = value_len
         
         current_row += 1
     
@@ -1940,7 +2451,7 @@ def delete_report(request, report_id):
         return JsonResponse({'success': True, 'message': 'Report deleted successfully'})
         
     except Exception as e:
-        print(f"Error deleting report: {str(e)}")
+        logger.exception("Error deleting report")
         return JsonResponse({'success': False, 'message': str(e)})
 
 
@@ -1951,86 +2462,54 @@ def results_view(request):
     
     # Fetch all departments, programs, and types for filters
     try:
-        departments = get_all_documents('departments')
-        departments = [d for d in departments if d.get('is_active', True) and not d.get('is_archived', False)]
-        departments.sort(key=lambda x: x.get('name', ''))
-        
-        programs = get_all_documents('programs')
-        programs = [p for p in programs if p.get('is_active', True) and not p.get('is_archived', False)]
-        programs.sort(key=lambda x: x.get('code', ''))
-        
-        types = get_all_documents('accreditation_types')
-        types = [t for t in types if t.get('is_active', True) and not t.get('is_archived', False)]
-        types.sort(key=lambda x: x.get('name', ''))
-        
-        # Fetch all areas with their complete hierarchy
-        all_areas = get_all_documents('areas')
-        all_checklists = get_all_documents('checklists')
-        all_documents = get_all_documents('documents')
-        
-        # Build area data with progress and hierarchy info
+        # Three independent RPCs, issued concurrently; the is_active/is_archived
+        # predicates on the filter collections run server-side in Firestore.
+        # build_results_rows below fetches the rest and shares these through
+        # the request memo.
+        collections = fetch_collections_parallel(
+            ['departments', 'programs', 'accreditation_types'],
+            request=request
+        )
+
+        departments = collections['departments']
+        sort_by_field(departments, 'name')
+
+        programs = collections['programs']
+        sort_by_field(programs, 'code')
+
+        types = collections['accreditation_types']
+        sort_by_field(types, 'name')
+
+        # Build area data with progress and hierarchy info from the per-area
+        # records shared with the results/incentives Excel report; the
+        # collection fetches above are reused through the request memo
         areas_data = []
-        for area in all_areas:
-            if not area.get('is_active', True) or area.get('is_archived', False):
-                continue
-            
-            area_id = area.get('id')
-            type_id = area.get('type_id') or area.get('accreditation_type_id')
-            
-            # Get type info
-            accred_type = next((t for t in types if t.get('id') == type_id), None)
-            if not accred_type:
-                continue
-            
-            # Get program info
-            prog_id = accred_type.get('program_id')
-            program = next((p for p in programs if p.get('id') == prog_id), None)
-            if not program:
-                continue
-            
-            # Get department info
-            dept_id = program.get('department_id')
-            department = next((d for d in departments if d.get('id') == dept_id), None)
-            if not department:
-                continue
-            
-            # Calculate area progress
-            area_checklists = [c for c in all_checklists if c.get('area_id') == area_id]
-            if not area_checklists:
-                progress = 0
+        for row in build_results_rows(request=request):
+            area = row['area']
+            department = row['department']
+            program = row['program']
+            accred_type = row['type']
+
+            if row['total_checklists']:
+                progress = round(row['completed_checklists'] * (100.0 / row['total_checklists']))
             else:
-                total_checklists = len(area_checklists)
-                completed_checklists = 0
-                
-                for checklist in area_checklists:
-                    checklist_id = checklist.get('id')
-                    required_docs = [
-                        doc for doc in all_documents 
-                        if doc.get('checklist_id') == checklist_id 
-                        and doc.get('is_required', False)
-                        and not doc.get('is_archived', False)
-                        and doc.get('status') == 'approved'
-                    ]
-                    if len(required_docs) > 0:
-                        completed_checklists += 1
-                
-                progress = round((completed_checklists / total_checklists) * 100) if total_checklists > 0 else 0
+                progress = 0
             
             areas_data.append({
-                'area_id': area_id,
+                'area_id': area.get('id'),
                 'area_name': area.get('name', ''),
                 'dept_code': department.get('code', ''),
                 'dept_name': department.get('name', ''),
                 'prog_code': program.get('code', ''),
                 'prog_name': program.get('name', ''),
-                'type_id': type_id,
+                'type_id': area.get('type_id') or area.get('accreditation_type_id'),
                 'type_name': accred_type.get('name', ''),
                 'progress': progress,
                 'certificate_issued': area.get('certificate_issued', False)
             })
         
         # Sort by department, program, type, area
-        areas_data.sort(key=lambda x: (x['dept_code'], x['prog_code'], x['type_name'], x['area_name']))
+        areas_data.sort(key=itemgetter('dept_code', 'prog_code', 'type_name', 'area_name'))
         
         # Pagination - 10 items per page
         from math import ceil
@@ -2065,7 +2544,7 @@ def results_view(request):
                 page_range = [1, '...'] + list(range(page - 1, page + 2)) + ['...', total_pages]
         
     except Exception as e:
-        print(f"Error fetching results data: {str(e)}")
+        logger.exception("Error fetching results data")
         departments = []
         programs = []
         types = []
@@ -2117,18 +2596,12 @@ def toggle_certificate_view(request, area_id):
         documents = get_all_documents('documents')
         
         total_checklists = len(checklists)
-        completed_checklists = 0
-        
-        for checklist in checklists:
-            checklist_id = checklist.get('id')
-            # Check if checklist has at least one required document
-            has_required_doc = any(
-                doc.get('checklist_id') == checklist_id and doc.get('is_required', False)
-                for doc in documents
-            )
-            if has_required_doc:
-                completed_checklists += 1
-        
+        # A checklist counts as completed when at least one required document exists
+        required_checklist_ids = {
+            doc.get('checklist_id') for doc in documents if doc.get('is_required', False)
+        }
+        completed_checklists = sum(1 for c in checklists if c.get('id') in required_checklist_ids)
+
         area_progress = round((completed_checklists / total_checklists * 100)) if total_checklists > 0 else 0
         
         # Validate that area is 100% complete before issuing certificate
@@ -2248,7 +2721,7 @@ def settings_view(request):
                     created_at = dt.fromisoformat(created_at.replace('Z', '+00:00'))
                     print(f"DEBUG - created_at converted (string): {created_at}")
                 except Exception as e:
-                    print(f"DEBUG - Error parsing created_at: {e}")
+                    logger.exception("DEBUG - Error parsing created_at")
                     created_at = None
         else:
             print("DEBUG - created_at is None or empty")
@@ -2306,6 +2779,10 @@ def upload_profile_image_view(request):
     
     user = get_user_from_session(request)
     
+    # Reject oversize bodies from the header, before Django parses them
+    if upload_exceeds_limit(request, 2 * 1024 * 1024):
+        return JsonResponse({'success': False, 'message': 'File size must be less than 2MB'})
+    
     if 'profile_image' not in request.FILES:
         return JsonResponse({'success': False, 'message': 'No image provided'})
     
@@ -2315,22 +2792,36 @@ def upload_profile_image_view(request):
     if image_file.size > 2 * 1024 * 1024:
         return JsonResponse({'success': False, 'message': 'File size must be less than 2MB'})
     
-    # Validate file type
-    allowed_types = ['image/jpeg', 'image/jpg', 'image/png']
-    if image_file.content_type not in allowed_types:
+    # Validate file type by sniffing the magic bytes: the Content-Type
+    # header is client-supplied, so a spoofed value would pass and a legit
+    # image sent as application/octet-stream would be rejected
+    head = image_file.read(12)
+    image_file.seek(0)
+    if not any(head.startswith(sig) for sig in _IMAGE_SIGNATURES):
         return JsonResponse({'success': False, 'message': 'Only JPG and PNG files are allowed'})
     
     try:
-        from accreditation.firebase_utils import update_document
-        from accreditation.cloudinary_utils import upload_image_to_cloudinary, delete_image_from_cloudinary
-        from datetime import datetime
-        
         # Get old profile image URL if exists
         old_image_url = user.get('profile_image_url', '')
+
+        # Hash the upload so a re-submitted identical image (e.g. a retry)
+        # skips the Cloudinary round-trips and Firestore write entirely
+        hasher = hashlib.sha256()
+        for chunk in image_file.chunks():
+            hasher.update(chunk)
+        image_hash = hasher.hexdigest()
+        image_file.seek(0)
+
+        if old_image_url and image_hash == user.get('profile_image_hash'):
+            return JsonResponse({
+                'success': True,
+                'message': 'Profile picture updated successfully',
+                'image_url': old_image_url
+            })
         
-        # Delete old image from Cloudinary if it exists
+        # Delete old image from Cloudinary off the request path
         if old_image_url and 'cloudinary.com' in old_image_url:
-            delete_image_from_cloudinary(old_image_url)
+            delete_image_in_background(old_image_url)
         
         # Upload new image to Cloudinary in 'profile' folder
         image_url = upload_image_to_cloudinary(image_file, folder='profile')
@@ -2341,6 +2832,7 @@ def upload_profile_image_view(request):
         # Update user document
         update_data = {
             'profile_image_url': image_url,
+            'profile_image_hash': image_hash,
             'updated_at': datetime.now()
         }
         
@@ -2353,6 +2845,7 @@ def upload_profile_image_view(request):
                 pass
             # Update session
             request.session['user']['profile_image_url'] = image_url
+            request.session['user']['profile_image_hash'] = image_hash
             request.session.modified = True
             
             return JsonResponse({
@@ -2364,7 +2857,7 @@ def upload_profile_image_view(request):
             return JsonResponse({'success': False, 'message': 'Failed to update profile picture'})
             
     except Exception as e:
-        print(f"Error uploading profile image: {str(e)}")
+        logger.exception("Error uploading profile image")
         return JsonResponse({'success': False, 'message': 'An error occurred while uploading'})
 
 
@@ -2377,20 +2870,17 @@ def remove_profile_image_view(request):
     user = get_user_from_session(request)
     
     try:
-        from accreditation.firebase_utils import update_document
-        from accreditation.cloudinary_utils import delete_image_from_cloudinary
-        from datetime import datetime
-        
         # Get old profile image URL if exists
         old_image_url = user.get('profile_image_url', '')
         
-        # Delete old image from Cloudinary if it exists
+        # Delete old image from Cloudinary off the request path
         if old_image_url and 'cloudinary.com' in old_image_url:
-            delete_image_from_cloudinary(old_image_url)
+            delete_image_in_background(old_image_url)
         
-        # Remove image URL from user document
+        # Remove image URL (and its content hash) from user document
         update_data = {
             'profile_image_url': None,
+            'profile_image_hash': None,
             'updated_at': datetime.now()
         }
         
@@ -2404,6 +2894,7 @@ def remove_profile_image_view(request):
             # Update session
             if 'profile_image_url' in request.session['user']:
                 del request.session['user']['profile_image_url']
+            request.session['user'].pop('profile_image_hash', None)
             request.session.modified = True
             
             # Generate default avatar URL
@@ -2418,7 +2909,7 @@ def remove_profile_image_view(request):
             return JsonResponse({'success': False, 'message': 'Failed to remove profile picture'})
             
     except Exception as e:
-        print(f"Error removing profile image: {str(e)}")
+        logger.exception("Error removing profile image")
         return JsonResponse({'success': False, 'message': 'An error occurred'})
 
 
@@ -2431,8 +2922,6 @@ def update_personal_info_view(request):
     user = get_user_from_session(request)
     
     try:
-        import json
-        from datetime import datetime
         data = json.loads(request.body)
         
         # Check if user role is department_user or qa_admin - they cannot edit name fields
@@ -2451,8 +2940,6 @@ def update_personal_info_view(request):
         if not first_name or not last_name:
             return JsonResponse({'success': False, 'message': 'First name and last name are required'})
         
-        from accreditation.firebase_utils import update_document
-        
         update_data = {
             'first_name': first_name,
             'middle_name': middle_name,
@@ -2477,7 +2964,7 @@ def update_personal_info_view(request):
             return JsonResponse({'success': False, 'message': 'Failed to update information'})
             
     except Exception as e:
-        print(f"Error updating personal info: {str(e)}")
+        logger.exception("Error updating personal info")
         return JsonResponse({'success': False, 'message': 'An error occurred'})
 
 
@@ -2490,12 +2977,6 @@ def change_password_view(request):
     user = get_user_from_session(request)
     
     try:
-        import json
-        import hashlib
-        import secrets
-        from datetime import datetime
-        from accreditation.firebase_utils import get_document, update_document
-        
         data = json.loads(request.body)
         
         current_password = data.get('current_password', '')
@@ -2543,8 +3024,9 @@ def change_password_view(request):
                                                        salt.encode('utf-8'),
                                                        100000)
                     computed_hash = password_hash.hex()
-                    
-                    if computed_hash == stored_hash:
+
+                    # Constant-time comparison to avoid timing leaks
+                    if secrets.compare_digest(computed_hash, stored_hash):
                         password_verified = True
                 except Exception as e:
                     pass
@@ -2611,34 +3093,43 @@ def user_management_view(request):
     department_filter = request.GET.get('department', '')
     role_filter = request.GET.get('role', '')
     search_query = request.GET.get('search', '')
-    
-    # Get all users
-    try:
-        all_users = get_all_documents('users')
-        
-        # Apply filters
-        filtered_users = all_users
-        
+    
+    # Get users matching the filters
+    try:
+        # Push the equality filters into Firestore so only matching user
+        # docs cross the wire
+        user_filters = []
         if department_filter:
-            filtered_users = [u for u in filtered_users if u.get('department') == department_filter]
-        
+            user_filters.append(('department', '==', department_filter))
         if role_filter:
-            filtered_users = [u for u in filtered_users if u.get('role') == role_filter]
-        
+            user_filters.append(('role', '==', role_filter))
+
+        def fetch_users():
+            if user_filters:
+                return query_documents_multi('users', user_filters)
+            return get_all_documents('users')
+
+        # Users, departments and roles are independent RPCs, issued concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            users_future = executor.submit(fetch_users)
+            departments_future = executor.submit(get_all_documents, 'departments')
+            roles_future = executor.submit(get_all_documents, 'roles')
+            filtered_users = users_future.result()
+            departments = departments_future.result()
+            roles = roles_future.result()
+
+        # Substring search stays in Python: Firestore has no contains
+        # operator and the set is already narrowed by the filters above
         if search_query:
             search_query = search_query.lower()
             filtered_users = [
-                u for u in filtered_users 
-                if search_query in u.get('first_name', '').lower()
-                or search_query in u.get('middle_name', '').lower()
-                or search_query in u.get('last_name', '').lower()
-                or search_query in u.get('email', '').lower()
+                u for u in filtered_users
+                if search_query in (
+                    f"{u.get('first_name', '')} {u.get('middle_name', '')} "
+                    f"{u.get('last_name', '')} {u.get('email', '')}"
+                ).lower()
             ]
         
-        # Get departments and roles for filters
-        departments = get_all_documents('departments')
-        roles = get_all_documents('roles')
-        
         # Create department mapping (code -> name)
         dept_mapping = {dept.get('code'): dept.get('name') for dept in departments if dept.get('code')}
         
@@ -2720,7 +3211,7 @@ def user_add_view(request):
             generated_password = generate_strong_password()
             
             # Check if user already exists
-            existing_users = query_documents('users', 'email', '==', email)
+            existing_users = query_documents('users', 'email', '==', email, limit=1)
             if existing_users:
                 return JsonResponse({
                     'success': False, 
@@ -2852,8 +3343,8 @@ def user_delete_view(request, user_id):
         return JsonResponse({'success': False, 'message': 'Access denied.'}, status=403)
     
     try:
-        # Get the user to delete
-        user_to_delete = safe_get_document('users', user_id)
+        # Get the user to delete (existence check plus the audited fields)
+        user_to_delete = safe_get_document('users', user_id, fields=['email', 'name'])
         if not user_to_delete:
             return JsonResponse({
                 'success': False, 
@@ -2881,11 +3372,7 @@ def user_delete_view(request, user_id):
         })
         
     except Exception as e:
-        # Print full traceback for debugging
-        print("="*80)
-        print("ERROR in user_delete_view:")
-        print(traceback.format_exc())
-        print("="*80)
+        logger.exception("Error in user_delete_view")
         return JsonResponse({
             'success': False, 
             'message': f'Error deleting user: {str(e)}'
@@ -2905,8 +3392,8 @@ def user_toggle_status_view(request, user_id):
         data = json.loads(request.body)
         is_active = data.get('is_active', True)
         
-        # Get the user to update
-        user_to_update = safe_get_document('users', user_id)
+        # Get the user to update (only the email is needed for the self-check)
+        user_to_update = safe_get_document('users', user_id, fields=['email'])
         if not user_to_update:
             return JsonResponse({
                 'success': False, 
@@ -2935,11 +3422,7 @@ def user_toggle_status_view(request, user_id):
             'message': 'Invalid request data.'
         }, status=400)
     except Exception as e:
-        # Print full traceback for debugging
-        print("="*80)
-        print("ERROR in user_toggle_status_view:")
-        print(traceback.format_exc())
-        print("="*80)
+        logger.exception("Error in user_toggle_status_view")
         return JsonResponse({
             'success': False, 
             'message': f'Error updating user status: {str(e)}'
@@ -2971,11 +3454,7 @@ def user_get_view(request, user_id):
         })
         
     except Exception as e:
-        # Print full traceback for debugging
-        print("="*80)
-        print("ERROR in user_get_view:")
-        print(traceback.format_exc())
-        print("="*80)
+        logger.exception("Error in user_get_view")
         return JsonResponse({
             'success': False, 
             'message': f'Error retrieving user: {str(e)}'
@@ -2988,7 +3467,7 @@ def accreditation_settings_view(request):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access Accreditation Settings.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -3007,10 +3486,10 @@ def accreditation_settings_view(request):
                 dept['logo_url'] = ''  # Use blank as default
         
         # Sort by name
-        departments.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(departments, 'name')
         
     except Exception as e:
-        print(f"Error fetching departments: {str(e)}")
+        logger.exception("Error fetching departments")
         departments = []
     
     from datetime import date
@@ -3030,7 +3509,7 @@ def set_deadline_view(request):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({'success': False, 'message': 'Access denied.'})
     
     try:
@@ -3134,9 +3613,7 @@ def set_deadline_view(request):
             print(f"Created notifications for {len(active_users)} users about deadline {action_message}")
             
         except Exception as notif_error:
-            print(f"Error creating deadline notifications: {str(notif_error)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating deadline notifications")
         
         # Log audit event
         try:
@@ -3151,7 +3628,7 @@ def set_deadline_view(request):
                 ip=ip
             )
         except Exception as audit_error:
-            print(f"Error logging audit trail: {str(audit_error)}")
+            logger.exception("Error logging audit trail")
         
         return JsonResponse({
             'success': True,
@@ -3161,9 +3638,7 @@ def set_deadline_view(request):
     except json.JSONDecodeError:
         return JsonResponse({'success': False, 'message': 'Invalid request format.'})
     except Exception as e:
-        print(f"Error setting deadline: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error setting deadline")
         return JsonResponse({'success': False, 'message': 'An error occurred while setting the deadline.'})
 
 
@@ -3197,7 +3672,7 @@ def get_deadline_view(request):
         })
         
     except Exception as e:
-        print(f"Error getting deadline: {str(e)}")
+        logger.exception("Error getting deadline")
         return JsonResponse({'success': False, 'message': 'An error occurred while fetching the deadline.'})
 
 
@@ -3207,7 +3682,7 @@ def system_appearance_view(request):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access System Appearance.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -3221,19 +3696,26 @@ def system_appearance_view(request):
     return render(request, 'dashboard/system_appearance.html', context)
 
 
+def fetch_appearance_settings_doc(request=None):
+    """
+    Fetch the appearance settings document via a server-side query.
+
+    Queries system_settings for setting_type == 'appearance' with a limit
+    of one instead of pulling the whole collection and scanning in Python.
+
+    Returns:
+        dict: The appearance settings document, or None if not created yet
+    """
+    docs = query_documents('system_settings', 'setting_type', '==', 'appearance', limit=1, request=request)
+    return docs[0] if docs else None
+
+
 @require_http_methods(["GET"])
 def get_appearance_settings(request):
     """Get current appearance settings - PUBLIC endpoint for login page"""
     try:
-        # Get settings from Firestore
-        settings_docs = get_all_documents('system_settings')
-        
-        # Find appearance settings document
-        appearance_settings = None
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                appearance_settings = doc
-                break
+        # Get the appearance settings document via a server-side query
+        appearance_settings = fetch_appearance_settings_doc(request)
         
         # Default settings if not found
         if not appearance_settings:
@@ -3241,15 +3723,26 @@ def get_appearance_settings(request):
                 'theme_color': '#4a9d4f',
                 'system_title': 'PLP Accreditation System',
                 'logo_url': '',
-                'login_bg_url': 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
             }
-        
-        return JsonResponse({
-            'success': True,
-            'settings': appearance_settings
-        })
+
+        # ETag over the settings so repeat anonymous visitors revalidate
+        # with an empty 304 instead of re-downloading the same body
+        etag = '"%s"' % hashlib.md5(
+            json.dumps(appearance_settings, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            response = HttpResponse(status=304)
+        else:
+            response = JsonResponse({
+                'success': True,
+                'settings': appearance_settings
+            })
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=60'
+        return response
     except Exception as e:
-        print(f"Error loading appearance settings: {e}")
+        logger.exception("Error loading appearance settings")
         # Return default settings on error
         return JsonResponse({
             'success': True,
@@ -3257,24 +3750,18 @@ def get_appearance_settings(request):
                 'theme_color': '#4a9d4f',
                 'system_title': 'PLP Accreditation System',
                 'logo_url': '',
-                'login_bg_url': 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
             }
         })
 
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def save_theme_color(request):
     """Save theme color setting"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
         data = json.loads(request.body)
         color = data.get('color', '#4a9d4f')
@@ -3286,16 +3773,9 @@ def save_theme_color(request):
                 'message': 'Invalid color format. Please use hex color format (e.g., #4a9d4f).'
             }, status=400)
         
-        # Get existing settings
-        settings_docs = get_all_documents('system_settings')
-        appearance_settings = None
-        settings_id = None
-        
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                appearance_settings = doc
-                settings_id = doc.get('id')
-                break
+        # Get existing settings via a server-side query
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
         
         # Update or create settings
         if settings_id:
@@ -3309,7 +3789,7 @@ def save_theme_color(request):
                 'theme_color': color,
                 'system_title': 'PLP Accreditation System',
                 'logo_url': '',
-                'login_bg_url': 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
             })
         
         # Log audit trail
@@ -3347,18 +3827,19 @@ def save_theme_color(request):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def upload_logo(request):
     """Upload system logo"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
+        # Reject oversize bodies from the header, before Django parses them
+        if upload_exceeds_limit(request, 5 * 1024 * 1024):
+            return JsonResponse({
+                'success': False,
+                'message': 'File size must be less than 5MB.'
+            }, status=413)
+
         if 'logo' not in request.FILES:
             return JsonResponse({
                 'success': False,
@@ -3374,25 +3855,14 @@ def upload_logo(request):
                 'message': 'File size must be less than 5MB.'
             }, status=400)
         
-        # Get existing settings to check for old logo
-        settings_docs = get_all_documents('system_settings')
-        appearance_settings = None
-        settings_id = None
-        old_logo_url = None
-        
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                appearance_settings = doc
-                settings_id = doc.get('id')
-                old_logo_url = doc.get('logo_url')
-                break
+        # Get existing settings to check for old logo (server-side query)
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
+        old_logo_url = appearance_settings.get('logo_url') if appearance_settings else None
         
         # Delete old logo from Cloudinary if exists
-        if old_logo_url and 'cloudinary' in old_logo_url:
-            try:
-                delete_image_from_cloudinary(old_logo_url)
-            except:
-                pass  # Continue even if deletion fails
+        if is_cloudinary_url(old_logo_url):
+            delete_image_in_background(old_logo_url)
         
         # Upload new logo to Cloudinary
         logo_url = upload_image_to_cloudinary(logo_file, folder='system/logos')
@@ -3409,7 +3879,7 @@ def upload_logo(request):
                 'theme_color': '#4a9d4f',
                 'system_title': 'PLP Accreditation System',
                 'logo_url': logo_url,
-                'login_bg_url': 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
             })
         
         # Log audit trail
@@ -3448,28 +3918,16 @@ def upload_logo(request):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def remove_logo(request):
     """Remove system logo"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
-        # Get existing settings
-        settings_docs = get_all_documents('system_settings')
-        settings_id = None
-        old_logo_url = None
-        
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                settings_id = doc.get('id')
-                old_logo_url = doc.get('logo_url')
-                break
+        # Get existing settings via a server-side query
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
+        old_logo_url = appearance_settings.get('logo_url') if appearance_settings else None
         
         if not settings_id:
             return JsonResponse({
@@ -3478,11 +3936,8 @@ def remove_logo(request):
             }, status=404)
         
         # Delete logo from Cloudinary if exists
-        if old_logo_url and 'cloudinary' in old_logo_url:
-            try:
-                delete_image_from_cloudinary(old_logo_url)
-            except:
-                pass  # Continue even if deletion fails
+        if is_cloudinary_url(old_logo_url):
+            delete_image_in_background(old_logo_url)
         
         # Update settings
         update_document('system_settings', settings_id, {
@@ -3525,17 +3980,11 @@ def remove_logo(request):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def save_system_title(request):
     """Save system title setting"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
         data = json.loads(request.body)
         title = data.get('title', 'PLP Accreditation System').strip()
@@ -3553,16 +4002,16 @@ def save_system_title(request):
                 'message': 'System title must be 50 characters or less.'
             }, status=400)
         
-        # Get existing settings
-        settings_docs = get_all_documents('system_settings')
-        appearance_settings = None
-        settings_id = None
+        # Get existing settings via a server-side query
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
         
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                appearance_settings = doc
-                settings_id = doc.get('id')
-                break
+        # No-op save: skip the write and audit round trips
+        if settings_id and appearance_settings.get('system_title') == title:
+            return JsonResponse({
+                'success': True,
+                'message': 'System title saved successfully.'
+            })
         
         # Update or create settings
         if settings_id:
@@ -3576,7 +4025,7 @@ def save_system_title(request):
                 'theme_color': '#4a9d4f',
                 'system_title': title,
                 'logo_url': '',
-                'login_bg_url': 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
             })
         
         # Log audit trail
@@ -3614,18 +4063,19 @@ def save_system_title(request):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def upload_background(request):
     """Upload login background image"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
+        # Reject oversize bodies from the header, before Django parses them
+        if upload_exceeds_limit(request, 5 * 1024 * 1024):
+            return JsonResponse({
+                'success': False,
+                'message': 'File size must be less than 5MB.'
+            }, status=413)
+
         if 'background' not in request.FILES:
             return JsonResponse({
                 'success': False,
@@ -3641,25 +4091,14 @@ def upload_background(request):
                 'message': 'File size must be less than 5MB.'
             }, status=400)
         
-        # Get existing settings to check for old background
-        settings_docs = get_all_documents('system_settings')
-        appearance_settings = None
-        settings_id = None
-        old_bg_url = None
-        
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                appearance_settings = doc
-                settings_id = doc.get('id')
-                old_bg_url = doc.get('login_bg_url')
-                break
+        # Get existing settings to check for old background (server-side query)
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
+        old_bg_url = appearance_settings.get('login_bg_url') if appearance_settings else None
         
         # Delete old background from Cloudinary if exists and not default
-        if old_bg_url and 'cloudinary' in old_bg_url and 'bg_qhybsq' not in old_bg_url:
-            try:
-                delete_image_from_cloudinary(old_bg_url)
-            except:
-                pass  # Continue even if deletion fails
+        if is_cloudinary_url(old_bg_url) and old_bg_url != DEFAULT_LOGIN_BG_URL:
+            delete_image_in_background(old_bg_url)
         
         # Upload new background to Cloudinary
         bg_url = upload_image_to_cloudinary(bg_file, folder='system/backgrounds')
@@ -3715,28 +4154,16 @@ def upload_background(request):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
 def remove_background(request):
     """Remove login background image"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied. Only QA Head and QA Admin can modify appearance settings.'
-        }, status=403)
-    
     try:
-        # Get existing settings
-        settings_docs = get_all_documents('system_settings')
-        settings_id = None
-        old_bg_url = None
-        
-        for doc in settings_docs:
-            if doc.get('setting_type') == 'appearance':
-                settings_id = doc.get('id')
-                old_bg_url = doc.get('login_bg_url')
-                break
+        # Get existing settings via a server-side query
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
+        old_bg_url = appearance_settings.get('login_bg_url') if appearance_settings else None
         
         if not settings_id:
             return JsonResponse({
@@ -3745,14 +4172,11 @@ def remove_background(request):
             }, status=404)
         
         # Delete background from Cloudinary if exists and not default
-        if old_bg_url and 'cloudinary' in old_bg_url and 'bg_qhybsq' not in old_bg_url:
-            try:
-                delete_image_from_cloudinary(old_bg_url)
-            except:
-                pass  # Continue even if deletion fails
+        if is_cloudinary_url(old_bg_url) and old_bg_url != DEFAULT_LOGIN_BG_URL:
+            delete_image_in_background(old_bg_url)
         
         # Reset to default background
-        default_bg = 'https://res.cloudinary.com/dygrh6ztt/image/upload/v1761284342/bg_qhybsq.jpg'
+        default_bg = DEFAULT_LOGIN_BG_URL
         update_document('system_settings', settings_id, {
             'login_bg_url': default_bg,
             'updated_at': datetime.now()
@@ -3791,6 +4215,139 @@ def remove_background(request):
         }, status=500)
 
 
+@login_required
+@require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin', message='Access denied. Only QA Head and QA Admin can modify appearance settings.')
+def update_appearance_view(request):
+    """Update any subset of appearance settings in one request"""
+    user = get_user_from_session(request)
+
+    try:
+        # Reject oversize bodies from the header, before Django parses them
+        if upload_exceeds_limit(request, 10 * 1024 * 1024):
+            return JsonResponse({
+                'success': False,
+                'message': 'Combined file size must be less than 10MB.'
+            }, status=413)
+
+        title = request.POST.get('title', '').strip() if 'title' in request.POST else None
+        theme_color = request.POST.get('theme_color', '').strip() if 'theme_color' in request.POST else None
+        logo_file = request.FILES.get('logo')
+        bg_file = request.FILES.get('background')
+
+        if title is None and theme_color is None and not logo_file and not bg_file:
+            return JsonResponse({
+                'success': False,
+                'message': 'No appearance fields provided.'
+            }, status=400)
+
+        # Validate before any uploads, mirroring the single-field endpoints
+        if title is not None:
+            if not title:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'System title cannot be empty.'
+                }, status=400)
+            if len(title) > 50:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'System title must be 50 characters or less.'
+                }, status=400)
+
+        if theme_color is not None:
+            if not theme_color.startswith('#') or len(theme_color) != 7:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Invalid color format. Please use hex color format (e.g., #4a9d4f).'
+                }, status=400)
+
+        for upload in (logo_file, bg_file):
+            if upload and upload.size > 5 * 1024 * 1024:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'File size must be less than 5MB.'
+                }, status=400)
+
+        appearance_settings = fetch_appearance_settings_doc(request)
+        settings_id = appearance_settings.get('id') if appearance_settings else None
+        old_logo_url = appearance_settings.get('logo_url') if appearance_settings else None
+        old_bg_url = appearance_settings.get('login_bg_url') if appearance_settings else None
+
+        update_data = {}
+        if title is not None:
+            update_data['system_title'] = title
+        if theme_color is not None:
+            update_data['theme_color'] = theme_color
+
+        # Run both Cloudinary uploads concurrently
+        if logo_file or bg_file:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                logo_future = executor.submit(upload_image_to_cloudinary, logo_file, 'system/logos') if logo_file else None
+                bg_future = executor.submit(upload_image_to_cloudinary, bg_file, 'system/backgrounds') if bg_file else None
+                if logo_future:
+                    update_data['logo_url'] = logo_future.result()
+                if bg_future:
+                    update_data['login_bg_url'] = bg_future.result()
+
+        # Drop replaced assets off the response path
+        if logo_file and is_cloudinary_url(old_logo_url):
+            delete_image_in_background(old_logo_url)
+        if bg_file and is_cloudinary_url(old_bg_url) and old_bg_url != DEFAULT_LOGIN_BG_URL:
+            delete_image_in_background(old_bg_url)
+
+        update_data['updated_at'] = datetime.now()
+
+        # One write for every changed field
+        if settings_id:
+            update_document('system_settings', settings_id, update_data)
+        else:
+            settings_data = {
+                'setting_type': 'appearance',
+                'theme_color': '#4a9d4f',
+                'system_title': 'PLP Accreditation System',
+                'logo_url': '',
+                'login_bg_url': DEFAULT_LOGIN_BG_URL
+            }
+            settings_data.update(update_data)
+            create_document('system_settings', settings_data)
+
+        changed = sorted(field for field in update_data if field != 'updated_at')
+
+        # One audit entry covering the whole save
+        log_audit(
+            user=user,
+            action_type='update',
+            resource_type='system_appearance',
+            resource_id='appearance',
+            details=f"Updated appearance settings: {', '.join(changed)}",
+            status='success',
+            ip=get_client_ip(request)
+        )
+
+        return JsonResponse({
+            'success': True,
+            'message': 'Appearance settings saved successfully.',
+            'logo_url': update_data.get('logo_url'),
+            'login_bg_url': update_data.get('login_bg_url')
+        })
+    except Exception as e:
+        # Log failed audit
+        log_audit(
+            user=user,
+            action_type='update',
+            resource_type='system_appearance',
+            resource_id='appearance',
+            details=f"Failed to update appearance settings: {str(e)}",
+            status='failed',
+            ip=get_client_ip(request)
+        )
+
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=500)
+
+
 @login_required
 @require_http_methods(["POST"])
 def change_password_first_time_view(request):
@@ -3823,7 +4380,7 @@ def change_password_first_time_view(request):
         
         # Get user from database
         user_id = user.get('id')
-        users = query_documents('users', 'email', '==', user.get('email'))
+        users = query_documents('users', 'email', '==', user.get('email'), limit=1)
         
         if not users:
             return JsonResponse({
@@ -3900,17 +4457,11 @@ def dashboard_view(request):
 # Department CRUD Views
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin')
 def department_add_view(request):
     """Add a new department"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         name = request.POST.get('name', '').strip()
         logo_file = request.FILES.get('logo')
@@ -3950,14 +4501,18 @@ def department_add_view(request):
         # Generate department code (e.g., "CCS", "CBA")
         code = ''.join([word[0].upper() for word in name.split()[:3]])
         
-        # Check if code already exists
-        existing_dept = get_document('departments', code)
-        if existing_dept:
-            # Try adding a number suffix
-            counter = 1
-            while get_document('departments', f"{code}{counter}"):
-                counter += 1
-            code = f"{code}{counter}"
+        # Check for collisions with one prefix query instead of a
+        # get_document round trip per suffix candidate
+        existing_depts = query_documents_multi('departments', [
+            ('code', '>=', code),
+            ('code', '<=', code + '\uf8ff'),  # high code point: prefix range upper bound
+        ])
+        taken_codes = {dept.get('code') for dept in existing_depts}
+        if code in taken_codes:
+            # Pick the next free numeric suffix locally
+            suffixes = [int(taken[len(code):]) for taken in taken_codes
+                        if taken and taken[len(code):].isdigit()]
+            code = f"{code}{max(suffixes) + 1 if suffixes else 1}"
         
         # Create department
         dept_data = {
@@ -3987,17 +4542,11 @@ def department_add_view(request):
 
 
 @login_required
+@require_role_json('qa_head', 'qa_admin')
 def department_get_view(request, dept_id):
     """Get department details"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         dept = get_document('departments', dept_id)
         
@@ -4021,20 +4570,14 @@ def department_get_view(request, dept_id):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin')
 def department_edit_view(request, dept_id):
     """Edit department"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         # Check if department exists
-        dept = get_document('departments', dept_id)
+        dept = get_document('departments', dept_id, fields=['name'])
         if not dept:
             return JsonResponse({
                 'success': False,
@@ -4062,9 +4605,8 @@ def department_edit_view(request, dept_id):
         if logo_file:
             try:
                 # Delete old logo from Cloudinary if it exists and is from our account
-                if current_logo_url and 'dygrh6ztt' in current_logo_url:
-                    from accreditation.cloudinary_utils import delete_image_from_cloudinary
-                    delete_image_from_cloudinary(current_logo_url)
+                if is_cloudinary_url(current_logo_url):
+                    delete_image_in_background(current_logo_url)
                 
                 # Upload new logo
                 logo_url = upload_image_to_cloudinary(logo_file, folder='departments')
@@ -4103,20 +4645,14 @@ def department_edit_view(request, dept_id):
 
 @login_required
 @require_http_methods(["POST"])
+@require_role_json('qa_head', 'qa_admin')
 def department_archive_view(request, dept_id):
     """Archive/Unarchive department"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         # Check if department exists
-        dept = get_document('departments', dept_id)
+        dept = get_document('departments', dept_id, fields=['name', 'is_archived'])
         if not dept:
             return JsonResponse({
                 'success': False,
@@ -4127,8 +4663,9 @@ def department_archive_view(request, dept_id):
         data = json.loads(request.body)
         is_archived = data.get('is_archived', False)
         
-        # Update department
-        update_document('departments', dept_id, {'is_archived': is_archived})
+        # Update department unless it is already in the requested state
+        if bool(dept.get('is_archived', False)) != bool(is_archived):
+            update_document('departments', dept_id, {'is_archived': is_archived})
         
         action = 'archived' if is_archived else 'unarchived'
         return JsonResponse({
@@ -4143,20 +4680,14 @@ def department_archive_view(request, dept_id):
         }, status=500)
 
 
+@require_role_json('qa_head', 'qa_admin')
 def department_delete_view(request, dept_id):
     """Delete department"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         # Check if department exists
-        dept = get_document('departments', dept_id)
+        dept = get_document('departments', dept_id, fields=['name', 'logo_url'])
         if not dept:
             return JsonResponse({
                 'success': False,
@@ -4167,13 +4698,8 @@ def department_delete_view(request, dept_id):
         logo_url = dept.get('logo_url', '')
         
         # Delete logo from Cloudinary if it exists and is from our account
-        if logo_url and 'dygrh6ztt' in logo_url:
-            from accreditation.cloudinary_utils import delete_image_from_cloudinary
-            try:
-                delete_image_from_cloudinary(logo_url)
-            except Exception as e:
-                print(f"Warning: Could not delete logo from Cloudinary: {str(e)}")
-                # Continue with deletion even if logo deletion fails
+        if is_cloudinary_url(logo_url):
+            delete_image_in_background(logo_url)
         
         # Delete department
         delete_document('departments', dept_id)
@@ -4194,20 +4720,14 @@ def department_delete_view(request, dept_id):
         }, status=500)
 
 
+@require_role_json('qa_head', 'qa_admin')
 def department_toggle_active_view(request, dept_id):
     """Toggle department active status"""
     user = get_user_from_session(request)
     
-    # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
-        return JsonResponse({
-            'success': False,
-            'message': 'Access denied.'
-        }, status=403)
-    
     try:
         # Check if department exists
-        dept = get_document('departments', dept_id)
+        dept = get_document('departments', dept_id, fields=['name', 'is_active'])
         if not dept:
             return JsonResponse({
                 'success': False,
@@ -4218,8 +4738,9 @@ def department_toggle_active_view(request, dept_id):
         data = json.loads(request.body)
         is_active = data.get('is_active', False)
         
-        # Update department
-        update_document('departments', dept_id, {'is_active': is_active})
+        # Update department unless it is already in the requested state
+        if bool(dept.get('is_active', False)) != bool(is_active):
+            update_document('departments', dept_id, {'is_active': is_active})
         
         action = 'activated' if is_active else 'deactivated'
         return JsonResponse({
@@ -4244,7 +4765,7 @@ def department_programs_view(request, dept_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access Programs.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -4258,9 +4779,8 @@ def department_programs_view(request, dept_id):
             messages.error(request, 'Department not found.')
             return redirect('dashboard:accreditation_settings')
         
-        # Fetch programs for this department
-        all_programs = get_all_documents('programs')
-        programs = [p for p in all_programs if p.get('department_id') == dept_id]
+        # Fetch programs for this department (server-side filter)
+        programs = query_documents('programs', 'department_id', '==', dept_id, request=request)
         
         # Set default values if not present
         for prog in programs:
@@ -4270,10 +4790,10 @@ def department_programs_view(request, dept_id):
                 prog['is_active'] = True
         
         # Sort by code
-        programs.sort(key=lambda x: x.get('code', ''))
+        sort_by_field(programs, 'code')
         
     except Exception as e:
-        print(f"Error fetching programs: {str(e)}")
+        logger.exception("Error fetching programs")
         programs = []
         department = {'name': 'Unknown Department', 'code': dept_id}
     
@@ -4293,7 +4813,7 @@ def program_add_view(request, dept_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4367,7 +4887,7 @@ def program_get_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4401,7 +4921,7 @@ def program_edit_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4456,7 +4976,7 @@ def program_archive_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4498,7 +5018,7 @@ def program_delete_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4541,7 +5061,7 @@ def program_toggle_active_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4586,7 +5106,7 @@ def program_types_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access Accreditation Types.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -4605,9 +5125,8 @@ def program_types_view(request, dept_id, prog_id):
             messages.error(request, 'Program not found.')
             return redirect('dashboard:department_programs', dept_id=dept_id)
         
-        # Fetch accreditation types for this program
-        all_types = get_all_documents('accreditation_types')
-        types = [t for t in all_types if t.get('program_id') == prog_id]
+        # Fetch accreditation types for this program (server-side filter)
+        types = query_documents('accreditation_types', 'program_id', '==', prog_id, request=request)
         
         # Set default values if not present
         for type_item in types:
@@ -4619,10 +5138,10 @@ def program_types_view(request, dept_id, prog_id):
                 type_item['logo_url'] = ''
         
         # Sort by name
-        types.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(types, 'name')
         
     except Exception as e:
-        print(f"Error fetching accreditation types: {str(e)}")
+        logger.exception("Error fetching accreditation types")
         types = []
         program = {'name': 'Unknown Program', 'code': prog_id}
         department = {'name': 'Unknown Department', 'code': dept_id}
@@ -4644,7 +5163,7 @@ def accreditation_type_add_view(request, dept_id, prog_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4723,7 +5242,7 @@ def accreditation_type_get_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4756,7 +5275,7 @@ def accreditation_type_edit_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4797,7 +5316,7 @@ def accreditation_type_edit_view(request, dept_id, prog_id, type_id):
                 # Delete old logo if exists
                 old_logo_url = type_item.get('logo_url')
                 if old_logo_url:
-                    delete_image_from_cloudinary(old_logo_url)
+                    delete_image_in_background(old_logo_url)
                 
                 logo_url = upload_image_to_cloudinary(logo_file, 'departments')
                 update_data['logo_url'] = logo_url
@@ -4829,7 +5348,7 @@ def accreditation_type_archive_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4871,7 +5390,7 @@ def accreditation_type_delete_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4891,10 +5410,7 @@ def accreditation_type_delete_view(request, dept_id, prog_id, type_id):
         # Delete logo from Cloudinary if exists
         logo_url = type_item.get('logo_url')
         if logo_url:
-            try:
-                delete_image_from_cloudinary(logo_url)
-            except Exception as e:
-                print(f"Error deleting logo from Cloudinary: {str(e)}")
+            delete_image_in_background(logo_url)
         
         # Delete type
         delete_document('accreditation_types', type_id)
@@ -4922,7 +5438,7 @@ def accreditation_type_toggle_active_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -4967,7 +5483,7 @@ def type_areas_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access Areas.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -5003,10 +5519,10 @@ def type_areas_view(request, dept_id, prog_id, type_id):
                 area['is_active'] = True
         
         # Sort by name
-        areas.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(areas, 'name')
         
     except Exception as e:
-        print(f"Error fetching areas: {str(e)}")
+        logger.exception("Error fetching areas")
         areas = []
         accreditation_type = {'name': 'Unknown Type', 'id': type_id}
         program = {'name': 'Unknown Program', 'code': prog_id}
@@ -5030,7 +5546,7 @@ def area_add_view(request, dept_id, prog_id, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5096,7 +5612,7 @@ def area_get_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5129,7 +5645,7 @@ def area_edit_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5180,7 +5696,7 @@ def area_archive_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5222,7 +5738,7 @@ def area_delete_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5265,7 +5781,7 @@ def area_toggle_active_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5310,7 +5826,7 @@ def area_checklists_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied. Only QA Head and QA Admin can access Checklists.')
         return render(request, 'dashboard_base.html', {
             'active_page': 'dashboard',
@@ -5345,6 +5861,15 @@ def area_checklists_view(request, dept_id, prog_id, type_id, area_id):
         
         # Get all documents to calculate progress for each checklist
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         # Set default values if not present and add progress
         for checklist in checklists:
@@ -5353,17 +5878,8 @@ def area_checklists_view(request, dept_id, prog_id, type_id, area_id):
             if 'is_active' not in checklist:
                 checklist['is_active'] = True
             
-            # Calculate progress based on required documents
-            checklist_id = checklist.get('id')
-            required_docs = [
-                doc for doc in all_documents 
-                if doc.get('checklist_id') == checklist_id 
-                and doc.get('is_required', False)
-                and not doc.get('is_archived', False)
-                and doc.get('status') == 'approved'
-            ]
-            # Progress is 100% if there's at least 1 required document, otherwise 0%
-            checklist['progress'] = 100 if len(required_docs) > 0 else 0
+            # Progress is 100% if there's at least 1 approved required document, otherwise 0%
+            checklist['progress'] = 100 if checklist.get('id') in approved_checklist_ids else 0
         
         # Sort by checklist number (extract number from "Checklist X")
         def get_checklist_number(checklist):
@@ -5379,7 +5895,7 @@ def area_checklists_view(request, dept_id, prog_id, type_id, area_id):
         checklists.sort(key=get_checklist_number)
         
     except Exception as e:
-        print(f"Error fetching checklists: {str(e)}")
+        logger.exception("Error fetching checklists")
         checklists = []
         area = {'name': 'Unknown Area', 'id': area_id}
         accreditation_type = {'name': 'Unknown Type', 'id': type_id}
@@ -5405,7 +5921,7 @@ def checklist_add_view(request, dept_id, prog_id, type_id, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5471,7 +5987,7 @@ def checklist_get_view(request, dept_id, prog_id, type_id, area_id, checklist_id
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5504,7 +6020,7 @@ def checklist_edit_view(request, dept_id, prog_id, type_id, area_id, checklist_i
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5555,7 +6071,7 @@ def checklist_archive_view(request, dept_id, prog_id, type_id, area_id, checklis
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5597,7 +6113,7 @@ def checklist_delete_view(request, dept_id, prog_id, type_id, area_id, checklist
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5640,7 +6156,7 @@ def checklist_toggle_active_view(request, dept_id, prog_id, type_id, area_id, ch
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5812,8 +6328,7 @@ def archive_api_areas(request):
         
     except Exception as e:
         import traceback
-        print(f"Error in archive_api_areas: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in archive_api_areas")
         return JsonResponse({
             'success': False,
             'message': f'Error retrieving archived areas: {str(e)}'
@@ -5873,8 +6388,7 @@ def archive_api_checklists(request):
         
     except Exception as e:
         import traceback
-        print(f"Error in archive_api_checklists: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in archive_api_checklists")
         return JsonResponse({
             'success': False,
             'message': f'Error retrieving archived checklists: {str(e)}'
@@ -5888,7 +6402,7 @@ def archive_api_unarchive(request, item_type, item_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5943,7 +6457,7 @@ def archive_api_delete(request, item_type, item_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -5980,10 +6494,7 @@ def archive_api_delete(request, item_type, item_id):
         if item_type in ['departments', 'types']:
             logo_url = item.get('logo_url')
             if logo_url:
-                try:
-                    delete_image_from_cloudinary(logo_url)
-                except Exception as e:
-                    print(f"Error deleting image from Cloudinary: {str(e)}")
+                delete_image_in_background(logo_url)
         
         # Delete the item
         delete_document(collection, item_id)
@@ -6043,10 +6554,10 @@ def checklist_documents_view(request, dept_id, prog_id, type_id, area_id, checkl
         additional_documents = [doc for doc in documents if not doc.get('is_required', False)]
         
         # Sort required documents by creation date (most recent first)
-        required_documents.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        sort_by_field(required_documents, 'created_at', reverse=True)
         
         # Sort additional documents by creation date
-        additional_documents.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        sort_by_field(additional_documents, 'created_at', reverse=True)
         
         # Pagination for required documents - 10 per page
         from math import ceil
@@ -6107,7 +6618,7 @@ def checklist_documents_view(request, dept_id, prog_id, type_id, area_id, checkl
         required_document = paginated_required[0] if paginated_required else None
         
     except Exception as e:
-        print(f"Error fetching documents: {str(e)}")
+        logger.exception("Error fetching documents")
         messages.error(request, 'Error fetching documents.')
         return redirect('dashboard:accreditation')
     
@@ -6274,7 +6785,7 @@ def document_add_view(request, dept_id, prog_id, type_id, area_id, checklist_id)
                     file_ext = 'docx'
                     
                 except Exception as footer_error:
-                    print(f"Warning: Failed to add footer to document: {str(footer_error)}")
+                    logger.warning("Failed to add footer to document", exc_info=True)
                     # Continue with original file if footer addition fails
                     required_file.seek(0)
                     file_to_upload = required_file
@@ -6352,8 +6863,7 @@ def document_add_view(request, dept_id, prog_id, type_id, area_id, checklist_id)
                 print(f"[NOTIFICATION DEBUG] Notification created successfully!")
             except Exception as notif_error:
                 import traceback
-                print(f"[NOTIFICATION ERROR] Failed to create upload notification: {str(notif_error)}")
-                print(f"[NOTIFICATION ERROR] Traceback: {traceback.format_exc()}")
+                logger.exception("[NOTIFICATION ERROR] Failed to create upload notification")
             
             uploaded_count += 1
         
@@ -6432,7 +6942,7 @@ def document_add_view(request, dept_id, prog_id, type_id, area_id, checklist_id)
                         uploader_name=f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or user.get('email', 'Unknown')
                     )
                 except Exception as notif_error:
-                    print(f"Error creating upload notification: {str(notif_error)}")
+                    logger.exception("Error creating upload notification")
         
         total_docs = uploaded_count + len([f for f in additional_files if f.name])
         return JsonResponse({
@@ -6441,7 +6951,7 @@ def document_add_view(request, dept_id, prog_id, type_id, area_id, checklist_id)
         })
         
     except Exception as e:
-        print(f"Error adding documents: {str(e)}")
+        logger.exception("Error adding documents")
         return JsonResponse({
             'success': False,
             'message': f'Error uploading documents: {str(e)}'
@@ -6479,7 +6989,7 @@ def document_update_status_view(request, dept_id, prog_id, type_id, area_id, che
     user = get_user_from_session(request)
     
     # Only QA Head and QA Admin can update status
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Unauthorized'
@@ -6566,8 +7076,7 @@ def document_update_status_view(request, dept_id, prog_id, type_id, area_id, che
                 print(f"[STATUS NOTIFICATION] No uploader_id found, skipping notification")
         except Exception as notif_error:
             import traceback
-            print(f"[STATUS NOTIFICATION ERROR] Failed: {str(notif_error)}")
-            print(f"[STATUS NOTIFICATION ERROR] Traceback: {traceback.format_exc()}")
+            logger.exception("[STATUS NOTIFICATION ERROR] Failed")
         
         return JsonResponse({
             'success': True,
@@ -6705,9 +7214,7 @@ def document_proxy_view(request, dept_id, prog_id, type_id, area_id, checklist_i
                 return django_response
             
         except Exception as e:
-            print(f"Authenticated download failed: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Authenticated download failed")
         
         # If everything fails, return error message
         return HttpResponse(
@@ -6719,9 +7226,7 @@ def document_proxy_view(request, dept_id, prog_id, type_id, area_id, checklist_i
         )
         
     except Exception as e:
-        print(f"Error in proxy view: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in proxy view")
         return HttpResponse(f'Error: {str(e)}', status=500)
         return HttpResponse(f'Error loading document: {str(e)}', status=500)
 
@@ -6767,9 +7272,7 @@ def api_get_department_programs(request, dept_id):
         ]
         return JsonResponse({'programs': program_list})
     except Exception as e:
-        print(f"Error in api_get_department_programs: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in api_get_department_programs")
         return JsonResponse({'error': str(e), 'programs': []}, status=500)
 
 
@@ -6793,9 +7296,7 @@ def api_get_program_types(request, prog_id):
         ]
         return JsonResponse({'types': type_list})
     except Exception as e:
-        print(f"Error in api_get_program_types: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in api_get_program_types")
         return JsonResponse({'error': str(e), 'types': []}, status=500)
 
 
@@ -6819,9 +7320,7 @@ def api_get_type_areas(request, type_id):
         ]
         return JsonResponse({'areas': area_list})
     except Exception as e:
-        print(f"Error in api_get_type_areas: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in api_get_type_areas")
         return JsonResponse({'error': str(e), 'areas': []}, status=500)
 
 
@@ -6845,9 +7344,7 @@ def api_get_area_checklists(request, area_id):
         ]
         return JsonResponse({'checklists': checklist_list})
     except Exception as e:
-        print(f"Error in api_get_area_checklists: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in api_get_area_checklists")
         return JsonResponse({'error': str(e), 'checklists': []}, status=500)
 
 
@@ -6876,7 +7373,7 @@ def download_template_view(request):
         return response
         
     except Exception as e:
-        print(f"Error downloading template: {str(e)}")
+        logger.exception("Error downloading template")
         raise Http404("Error downloading template file")
 
 
@@ -6902,16 +7399,14 @@ def get_calendar_events(request):
         events_list = get_all_documents('calendar_events')
         
         # Sort by date
-        events_list.sort(key=lambda x: x.get('date', ''))
+        sort_by_field(events_list, 'date')
         
         return JsonResponse({
             'success': True,
             'events': events_list
         })
     except Exception as e:
-        print(f"Error getting calendar events: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting calendar events")
         return JsonResponse({
             'success': False,
             'message': str(e)
@@ -6983,7 +7478,7 @@ def create_calendar_event(request):
                 created_by=f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or user.get('email', 'Admin')
             )
         except Exception as notif_error:
-            print(f"Error creating event notification: {str(notif_error)}")
+            logger.exception("Error creating event notification")
         
         return JsonResponse({
             'success': True,
@@ -6992,7 +7487,7 @@ def create_calendar_event(request):
         })
         
     except Exception as e:
-        print(f"Error creating calendar event: {str(e)}")
+        logger.exception("Error creating calendar event")
         return JsonResponse({
             'success': False,
             'message': str(e)
@@ -7037,7 +7532,7 @@ def update_calendar_event(request, event_id):
         })
         
     except Exception as e:
-        print(f"Error updating calendar event: {str(e)}")
+        logger.exception("Error updating calendar event")
         return JsonResponse({
             'success': False,
             'message': str(e)
@@ -7074,7 +7569,7 @@ def delete_calendar_event(request, event_id):
         })
         
     except Exception as e:
-        print(f"Error deleting calendar event: {str(e)}")
+        logger.exception("Error deleting calendar event")
         return JsonResponse({
             'success': False,
             'message': str(e)
@@ -7114,7 +7609,7 @@ def archive_calendar_event(request, event_id):
         })
         
     except Exception as e:
-        print(f"Error archiving calendar event: {str(e)}")
+        logger.exception("Error archiving calendar event")
         return JsonResponse({
             'success': False,
             'message': str(e)
@@ -7129,7 +7624,7 @@ def audit_trail_view(request):
     user = get_user_from_session(request)
     
     # Only QA Head and QA Admin can view audit trail
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         messages.error(request, 'Access denied.')
         return redirect('dashboard:home')
     
@@ -7140,7 +7635,7 @@ def audit_trail_view(request):
         print(f"DEBUG: Fetched {len(audit_logs)} audit logs from database")
         
         # Sort by timestamp descending (newest first)
-        audit_logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        sort_by_field(audit_logs, 'timestamp', reverse=True)
         
         # Map old action types to new categorized action types
         action_category_map = {
@@ -7203,9 +7698,7 @@ def audit_trail_view(request):
                 log['details'] = 'No details provided'
         
     except Exception as e:
-        print(f"Error fetching audit logs: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching audit logs")
         audit_logs = []
         document_upload_count = 0
         record_modification_count = 0
@@ -7315,7 +7808,7 @@ def get_qa_head_dashboard_data(user):
         
         # Get recent activities from audit trail
         audit_logs = get_all_documents('audit_logs')
-        audit_logs.sort(key=lambda x: x.get('timestamp', datetime.min), reverse=True)
+        sort_by_field(audit_logs, 'timestamp', default=datetime.min, reverse=True)
         recent_activities = audit_logs[:10]
         
         # Format activities
@@ -7380,9 +7873,7 @@ def get_qa_head_dashboard_data(user):
             'department_progress': department_progress,
         }
     except Exception as e:
-        print(f"Error in get_qa_head_dashboard_data: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_qa_head_dashboard_data")
         return {
             'stats': {},
             'recent_activities': [],
@@ -7594,6 +8085,7 @@ def get_qa_admin_dashboard_data(user):
         # Get program progress (instead of area progress)
         all_types = get_all_documents('accreditation_types')
         all_areas = get_all_documents('areas')
+        areas_by_type = group_areas_by_type(all_areas)
         all_checklists = get_all_documents('checklists')
         
         program_progress = []
@@ -7619,7 +8111,7 @@ def get_qa_admin_dashboard_data(user):
             type_progresses = []
             for prog_type in prog_types:
                 type_id = prog_type.get('id')
-                type_areas = [a for a in all_areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+                type_areas = areas_by_type.get(type_id, [])
                 
                 if not type_areas:
                     type_progresses.append(0)
@@ -7649,7 +8141,7 @@ def get_qa_admin_dashboard_data(user):
                         if has_approved:
                             completed_checklists += 1
                     
-                    area_progress = (completed_checklists / area_total_checklists) * 100 if area_total_checklists > 0 else 0
+                    area_progress = completed_checklists * (100.0 / area_total_checklists)
                     area_progresses.append(area_progress)
                 
                 # Type progress is average of its areas
@@ -7703,9 +8195,7 @@ def get_qa_admin_dashboard_data(user):
             'recent_submitted_url': recent_submitted_url,
         }
     except Exception as e:
-        print(f"Error in get_qa_admin_dashboard_data: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_qa_admin_dashboard_data")
         return {
             'stats': {
                 'total_documents': 0,
@@ -7851,9 +8341,7 @@ def get_department_dashboard_data(user):
             'upcoming_deadlines': upcoming_deadlines,
         }
     except Exception as e:
-        print(f"Error in get_department_dashboard_data: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_department_dashboard_data")
         return {
             'stats': {},
             'area_progress': [],
@@ -7892,10 +8380,10 @@ def my_accreditation_view(request):
                 dept['logo_url'] = ''
         
         # Sort by name
-        departments.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(departments, 'name')
         
     except Exception as e:
-        print(f"Error fetching departments: {str(e)}")
+        logger.exception("Error fetching departments")
         departments = []
     
     # Fetch all active programs
@@ -7909,10 +8397,10 @@ def my_accreditation_view(request):
         ]
         
         # Sort by code
-        programs.sort(key=lambda x: x.get('code', ''))
+        sort_by_field(programs, 'code')
         
     except Exception as e:
-        print(f"Error fetching programs: {str(e)}")
+        logger.exception("Error fetching programs")
         programs = []
     
     # Fetch all active accreditation types
@@ -7926,10 +8414,10 @@ def my_accreditation_view(request):
         ]
         
         # Sort by type name
-        types.sort(key=lambda x: x.get('type', ''))
+        sort_by_field(types, 'type')
         
     except Exception as e:
-        print(f"Error fetching types: {str(e)}")
+        logger.exception("Error fetching types")
         types = []
     
     # Fetch all active areas
@@ -7943,17 +8431,27 @@ def my_accreditation_view(request):
         ]
         
         # Sort by name
-        areas.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(areas, 'name')
         
     except Exception as e:
-        print(f"Error fetching areas: {str(e)}")
+        logger.exception("Error fetching areas")
         areas = []
-    
+
     # Calculate progress for each department
     try:
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
-        
+        areas_by_type = group_areas_by_type(areas)
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
+
         for dept in departments:
             dept_id = dept.get('id')
             # Get all programs for this department
@@ -7977,7 +8475,7 @@ def my_accreditation_view(request):
                 type_progresses = []
                 for prog_type in prog_types:
                     type_id = prog_type.get('id')
-                    type_areas = [a for a in areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+                    type_areas = areas_by_type.get(type_id, [])
                     
                     if not type_areas:
                         type_progresses.append(0)
@@ -7994,21 +8492,12 @@ def my_accreditation_view(request):
                             continue
                         
                         total_checklists = len(area_checklists)
-                        completed_checklists = 0
-                        
-                        for checklist in area_checklists:
-                            checklist_id = checklist.get('id')
-                            required_docs = [
-                                doc for doc in all_documents 
-                                if doc.get('checklist_id') == checklist_id 
-                                and doc.get('is_required', False)
-                                and not doc.get('is_archived', False)
-                                and doc.get('status') == 'approved'
-                            ]
-                            if len(required_docs) > 0:
-                                completed_checklists += 1
+                        completed_checklists = sum(
+                            1 for checklist in area_checklists
+                            if checklist.get('id') in approved_checklist_ids
+                        )
                         
-                        area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
+                        area_progress = completed_checklists * (100.0 / total_checklists)
                         area_progresses.append(area_progress)
                     
                     # Type progress is average of its areas
@@ -8023,7 +8512,7 @@ def my_accreditation_view(request):
             dept['progress'] = round(sum(program_progresses) / len(program_progresses)) if program_progresses else 0
             
     except Exception as e:
-        print(f"Error calculating department progress: {str(e)}")
+        logger.exception("Error calculating department progress")
         for dept in departments:
             dept['progress'] = 0
     
@@ -8058,7 +8547,7 @@ def my_accreditation_department_programs_view(request, dept_id):
             messages.error(request, 'Department not found.')
             return redirect('dashboard:my_accreditation')
     except Exception as e:
-        print(f"Error fetching department: {str(e)}")
+        logger.exception("Error fetching department")
         messages.error(request, 'Error fetching department.')
         return redirect('dashboard:my_accreditation')
     
@@ -8071,13 +8560,23 @@ def my_accreditation_department_programs_view(request, dept_id):
             and prog.get('is_active', True) 
             and not prog.get('is_archived', False)
         ]
-        programs.sort(key=lambda x: x.get('code', ''))
+        sort_by_field(programs, 'code')
         
         # Calculate progress for each program based on its types
         all_types = get_all_documents('accreditation_types')
         all_areas = get_all_documents('areas')
+        areas_by_type = group_areas_by_type(all_areas)
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         for prog in programs:
             prog_id = prog.get('id')
@@ -8092,7 +8591,7 @@ def my_accreditation_department_programs_view(request, dept_id):
             type_progresses = []
             for prog_type in prog_types:
                 type_id = prog_type.get('id')
-                type_areas = [a for a in all_areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+                type_areas = areas_by_type.get(type_id, [])
                 
                 if not type_areas:
                     type_progresses.append(0)
@@ -8109,21 +8608,12 @@ def my_accreditation_department_programs_view(request, dept_id):
                         continue
                     
                     total_checklists = len(area_checklists)
-                    completed_checklists = 0
-                    
-                    for checklist in area_checklists:
-                        checklist_id = checklist.get('id')
-                        required_docs = [
-                            doc for doc in all_documents 
-                            if doc.get('checklist_id') == checklist_id 
-                            and doc.get('is_required', False)
-                            and not doc.get('is_archived', False)
-                            and doc.get('status') == 'approved'
-                        ]
-                        if len(required_docs) > 0:
-                            completed_checklists += 1
+                    completed_checklists = sum(
+                        1 for checklist in area_checklists
+                        if checklist.get('id') in approved_checklist_ids
+                    )
                     
-                    area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
+                    area_progress = completed_checklists * (100.0 / total_checklists)
                     area_progresses.append(area_progress)
                 
                 # Type progress is average of its areas
@@ -8134,7 +8624,7 @@ def my_accreditation_department_programs_view(request, dept_id):
             prog['progress'] = round(sum(type_progresses) / len(type_progresses)) if type_progresses else 0
             
     except Exception as e:
-        print(f"Error fetching programs: {str(e)}")
+        logger.exception("Error fetching programs")
         programs = []
     
     # Check if this is user's assigned department
@@ -8168,7 +8658,7 @@ def my_accreditation_program_types_view(request, dept_id, prog_id):
             messages.error(request, 'Department or Program not found.')
             return redirect('dashboard:my_accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:my_accreditation')
     
@@ -8181,17 +8671,27 @@ def my_accreditation_program_types_view(request, dept_id, prog_id):
             and t.get('is_active', True) 
             and not t.get('is_archived', False)
         ]
-        types.sort(key=lambda x: x.get('type', ''))
+        sort_by_field(types, 'type')
         
         # Calculate progress for each type based on its areas
         all_areas = get_all_documents('areas')
+        areas_by_type = group_areas_by_type(all_areas)
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         for accred_type in types:
             type_id = accred_type.get('id')
             # Get all areas for this type (check both type_id and accreditation_type_id)
-            type_areas = [a for a in all_areas if (a.get('type_id') == type_id or a.get('accreditation_type_id') == type_id)]
+            type_areas = areas_by_type.get(type_id, [])
             
             if not type_areas:
                 accred_type['progress'] = 0
@@ -8208,28 +8708,19 @@ def my_accreditation_program_types_view(request, dept_id, prog_id):
                     continue
                 
                 total_checklists = len(area_checklists)
-                completed_checklists = 0
-                
-                for checklist in area_checklists:
-                    checklist_id = checklist.get('id')
-                    required_docs = [
-                        doc for doc in all_documents 
-                        if doc.get('checklist_id') == checklist_id 
-                        and doc.get('is_required', False)
-                        and not doc.get('is_archived', False)
-                        and doc.get('status') == 'approved'
-                    ]
-                    if len(required_docs) > 0:
-                        completed_checklists += 1
+                completed_checklists = sum(
+                    1 for checklist in area_checklists
+                    if checklist.get('id') in approved_checklist_ids
+                )
                 
-                area_progress = (completed_checklists / total_checklists) * 100 if total_checklists > 0 else 0
+                area_progress = completed_checklists * (100.0 / total_checklists)
                 area_progresses.append(area_progress)
             
             # Type progress is the average of its areas' progress
             accred_type['progress'] = round(sum(area_progresses) / len(area_progresses)) if area_progresses else 0
             
     except Exception as e:
-        print(f"Error fetching types: {str(e)}")
+        logger.exception("Error fetching types")
         types = []
     
     # Check if this is user's assigned department
@@ -8264,7 +8755,7 @@ def my_accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             messages.error(request, 'Data not found.')
             return redirect('dashboard:my_accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:my_accreditation')
     
@@ -8277,11 +8768,20 @@ def my_accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             and mod.get('is_active', True) 
             and not mod.get('is_archived', False)
         ]
-        areas.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(areas, 'name')
         
         # Calculate progress for each area
         all_checklists = get_all_documents('checklists')
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         for area in areas:
             area_id = area.get('id')
@@ -8294,24 +8794,15 @@ def my_accreditation_type_areas_view(request, dept_id, prog_id, type_id):
             
             # Calculate progress based on required documents
             total_checklists = len(area_checklists)
-            completed_checklists = 0
-            
-            for checklist in area_checklists:
-                checklist_id = checklist.get('id')
-                required_docs = [
-                    doc for doc in all_documents 
-                    if doc.get('checklist_id') == checklist_id 
-                    and doc.get('is_required', False)
-                    and not doc.get('is_archived', False)
-                    and doc.get('status') == 'approved'
-                ]
-                if len(required_docs) > 0:
-                    completed_checklists += 1
+            completed_checklists = sum(
+                1 for checklist in area_checklists
+                if checklist.get('id') in approved_checklist_ids
+            )
             
-            area['progress'] = round((completed_checklists / total_checklists) * 100) if total_checklists > 0 else 0
+            area['progress'] = round(completed_checklists * (100.0 / total_checklists))
             
     except Exception as e:
-        print(f"Error fetching areas: {str(e)}")
+        logger.exception("Error fetching areas")
         areas = []
     
     # Check if this is user's assigned department
@@ -8349,7 +8840,7 @@ def my_accreditation_area_checklists_view(request, dept_id, prog_id, type_id, ar
             messages.error(request, 'Data not found.')
             return redirect('dashboard:my_accreditation')
     except Exception as e:
-        print(f"Error fetching data: {str(e)}")
+        logger.exception("Error fetching data")
         messages.error(request, 'Error fetching data.')
         return redirect('dashboard:my_accreditation')
     
@@ -8362,27 +8853,27 @@ def my_accreditation_area_checklists_view(request, dept_id, prog_id, type_id, ar
             and checklist.get('is_active', True) 
             and not checklist.get('is_archived', False)
         ]
-        checklists.sort(key=lambda x: x.get('name', ''))
+        sort_by_field(checklists, 'name')
         
         # Get all documents to calculate progress for each checklist
         all_documents = get_all_documents('documents')
+
+        # Checklists that have at least one approved required document (one pass
+        # over documents instead of a rescan per checklist)
+        approved_checklist_ids = {
+            doc.get('checklist_id') for doc in all_documents
+            if doc.get('is_required', False)
+            and not doc.get('is_archived', False)
+            and doc.get('status') == 'approved'
+        }
         
         # Add progress percentage to each checklist
         for checklist in checklists:
-            checklist_id = checklist.get('id')
-            # Get required documents for this checklist
-            required_docs = [
-                doc for doc in all_documents 
-                if doc.get('checklist_id') == checklist_id 
-                and doc.get('is_required', False)
-                and not doc.get('is_archived', False)
-                and doc.get('status') == 'approved'
-            ]
-            # Progress is 100% if there's at least 1 required document, otherwise 0%
-            checklist['progress'] = 100 if len(required_docs) > 0 else 0
+            # Progress is 100% if there's at least 1 approved required document, otherwise 0%
+            checklist['progress'] = 100 if checklist.get('id') in approved_checklist_ids else 0
             
     except Exception as e:
-        print(f"Error fetching checklists: {str(e)}")
+        logger.exception("Error fetching checklists")
         checklists = []
     
     # Check if this is user's assigned department
@@ -8445,10 +8936,10 @@ def my_accreditation_checklist_documents_view(request, dept_id, prog_id, type_id
         additional_documents = [doc for doc in documents if not doc.get('is_required', False)]
         
         # Sort required documents by creation date (most recent first)
-        required_documents.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        sort_by_field(required_documents, 'created_at', reverse=True)
         
         # Sort additional documents by creation date
-        additional_documents.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        sort_by_field(additional_documents, 'created_at', reverse=True)
         
         # Pagination for required documents - 10 per page
         from math import ceil
@@ -8509,7 +9000,7 @@ def my_accreditation_checklist_documents_view(request, dept_id, prog_id, type_id
         required_document = paginated_required[0] if paginated_required else None
         
     except Exception as e:
-        print(f"Error fetching documents: {str(e)}")
+        logger.exception("Error fetching documents")
         messages.error(request, 'Error fetching documents.')
         return redirect('dashboard:my_accreditation')
     
@@ -8585,7 +9076,7 @@ def my_accreditation_view_document(request, dept_id, prog_id, type_id, area_id,
         })
         
     except Exception as e:
-        print(f"Error viewing document: {str(e)}")
+        logger.exception("Error viewing document")
         return JsonResponse({'success': False, 'error': 'An error occurred while loading the document'})
 
 
@@ -8735,8 +9226,7 @@ def my_accreditation_download_document(request, dept_id, prog_id, type_id, area_
                     
             except Exception as convert_error:
                 import traceback
-                print(f"[CLOUDCONVERT] Conversion failed: {convert_error}")
-                print(f"[CLOUDCONVERT] Traceback:\n{traceback.format_exc()}")
+                logger.exception("[CLOUDCONVERT] Conversion failed")
                 # Fall through to return original DOCX
         
         # For non-DOCX or if conversion failed, return original file URL
@@ -8759,8 +9249,7 @@ def my_accreditation_download_document(request, dept_id, prog_id, type_id, area_
         
     except Exception as e:
         import traceback
-        print(f"Error in my_accreditation_download_document: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in my_accreditation_download_document")
         return JsonResponse({'success': False, 'error': 'An error occurred while preparing the download'})
 
 
@@ -8899,7 +9388,7 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
                     raise Exception("No API key available")
                     
             except Exception as api_error:
-                print(f"Online conversion failed: {api_error}")
+                logger.exception("Online conversion failed")
                 # Continue to try LibreOffice as fallback
         
         if should_convert:
@@ -8976,8 +9465,8 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
                         ip=get_client_ip(request)
                     )
                 except Exception as audit_error:
-                    print(f"Audit logging failed (non-critical): {audit_error}")
-                    print(f"Audit logging failed (non-critical): {audit_error}")
+                    logger.warning("Audit logging failed (non-critical)", exc_info=True)
+                    logger.warning("Audit logging failed (non-critical)", exc_info=True)
                 
                 # Read PDF file
                 with open(pdf_path, 'rb') as pdf_file:
@@ -8992,7 +9481,7 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
                     os.rmdir(temp_dir)
                     print("Cleaned up temporary files")
                 except Exception as cleanup_error:
-                    print(f"Cleanup error (non-critical): {cleanup_error}")
+                    logger.warning("Cleanup error (non-critical)", exc_info=True)
                 
                 # Return PDF file
                 http_response = HttpResponse(pdf_content, content_type='application/pdf')
@@ -9002,8 +9491,7 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
                 
             except Exception as convert_error:
                 import traceback
-                print(f"PDF CONVERSION ERROR: {convert_error}")
-                print(f"Full traceback:\n{traceback.format_exc()}")
+                logger.exception("PDF CONVERSION ERROR")
                 # Fall back to original file if conversion fails
                 print("Falling back to original DOCX file")
         
@@ -9029,8 +9517,8 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
                 ip=get_client_ip(request)
             )
         except Exception as audit_error:
-            print(f"Audit logging failed (non-critical): {audit_error}")
-            print(f"Audit logging failed (non-critical): {audit_error}")
+            logger.warning("Audit logging failed (non-critical)", exc_info=True)
+            logger.warning("Audit logging failed (non-critical)", exc_info=True)
         
         # Return success with download URL
         return JsonResponse({
@@ -9041,10 +9529,8 @@ def accreditation_download_document(request, dept_id, prog_id, type_id, area_id,
         })
         
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        print(f"Error downloading document (accreditation_download_document): {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error downloading document (accreditation_download_document)")
         return JsonResponse({'success': False, 'error': f'Error: {error_msg}'})
 
 
@@ -9173,7 +9659,7 @@ Pamantasan ng Lungsod ng Pasig
             )
             
         except Exception as email_error:
-            print(f"Error sending email: {str(email_error)}")
+            logger.exception("Error sending email")
             # Continue even if email fails - message is still saved in DB
         
         # Log audit trail
@@ -9193,7 +9679,7 @@ Pamantasan ng Lungsod ng Pasig
         })
         
     except Exception as e:
-        print(f"Error submitting contact form: {str(e)}")
+        logger.exception("Error submitting contact form")
         return JsonResponse({
             'success': False,
             'message': f'An error occurred: {str(e)}'
@@ -9210,7 +9696,7 @@ def archive_department_simple(request, dept_code):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -9250,7 +9736,7 @@ def archive_department_simple(request, dept_code):
         })
         
     except Exception as e:
-        print(f"Error archiving department: {str(e)}")
+        logger.exception("Error archiving department")
         return JsonResponse({
             'success': False,
             'message': f'Error archiving department: {str(e)}'
@@ -9263,7 +9749,7 @@ def archive_program_simple(request, prog_code):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -9303,7 +9789,7 @@ def archive_program_simple(request, prog_code):
         })
         
     except Exception as e:
-        print(f"Error archiving program: {str(e)}")
+        logger.exception("Error archiving program")
         return JsonResponse({
             'success': False,
             'message': f'Error archiving program: {str(e)}'
@@ -9316,7 +9802,7 @@ def archive_type_simple(request, type_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -9354,7 +9840,7 @@ def archive_type_simple(request, type_id):
         })
         
     except Exception as e:
-        print(f"Error archiving type: {str(e)}")
+        logger.exception("Error archiving type")
         return JsonResponse({
             'success': False,
             'message': f'Error archiving type: {str(e)}'
@@ -9367,7 +9853,7 @@ def archive_area_simple(request, area_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -9405,7 +9891,7 @@ def archive_area_simple(request, area_id):
         })
         
     except Exception as e:
-        print(f"Error archiving area: {str(e)}")
+        logger.exception("Error archiving area")
         return JsonResponse({
             'success': False,
             'message': f'Error archiving area: {str(e)}'
@@ -9418,7 +9904,7 @@ def archive_checklist_simple(request, checklist_id):
     user = get_user_from_session(request)
     
     # Check if user is QA Head or QA Admin
-    if user.get('role') not in ['qa_head', 'qa_admin']:
+    if user.get('role') not in ADMIN_ROLES:
         return JsonResponse({
             'success': False,
             'message': 'Access denied.'
@@ -9456,7 +9942,7 @@ def archive_checklist_simple(request, checklist_id):
         })
         
     except Exception as e:
-        print(f"Error archiving checklist: {str(e)}")
+        logger.exception("Error archiving checklist")
         return JsonResponse({
             'success': False,
             'message': f'Error archiving checklist: {str(e)}'
@@ -24,12 +24,13 @@ class UserRole:
         (QA_ADMIN, 'QA Admin'),
         (DEPARTMENT_USER, 'Department User'),
     ]
-    
+
+    _DISPLAY_NAMES = dict(CHOICES)
+
     @classmethod
     def get_role_display(cls, role):
         """Get display name for role"""
-        role_dict = dict(cls.CHOICES)
-        return role_dict.get(role, role)
+        return cls._DISPLAY_NAMES.get(role, role)
 
 
 class FirebaseUser:
@@ -118,7 +119,8 @@ class FirebaseUser:
                                               raw_password.encode('utf-8'),
                                               salt.encode('utf-8'),
                                               100000)
-            return stored_hash == password_hash.hex()
+            # Constant-time comparison so verification time leaks nothing
+            return secrets.compare_digest(stored_hash, password_hash.hex())
         except (ValueError, AttributeError):
             return False
     
@@ -110,13 +110,15 @@ class FirestoreHelper:
     
     # READ operations
     @retry_on_quota_exceeded(max_retries=3, initial_delay=1)
-    def get_document(self, collection_name: str, document_id: str) -> Optional[Dict[str, Any]]:
+    def get_document(self, collection_name: str, document_id: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Get a single document from Firestore
         
         Args:
             collection_name: Name of the collection
             document_id: ID of the document
+            fields: Optional list of field paths; when given, only these
+                fields are returned (server-side projection)
         
         Returns:
             Dict containing document data or None if not found
@@ -126,7 +128,7 @@ class FirestoreHelper:
         
         try:
             doc_ref = self.db.collection(collection_name).document(document_id)
-            doc = doc_ref.get()
+            doc = doc_ref.get(field_paths=fields) if fields else doc_ref.get()
             
             if doc.exists:
                 data = doc.to_dict()
@@ -168,6 +170,68 @@ class FirestoreHelper:
         except Exception as e:
             raise Exception(f"Error getting documents: {e}")
     
+    @retry_on_quota_exceeded(max_retries=3, initial_delay=1)
+    def get_active_documents(self, collection_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get active, non-archived documents from a collection
+
+        Applies the is_active/is_archived filters server-side so archived
+        rows are never transferred. Documents created by the app always
+        carry both flags.
+
+        Args:
+            collection_name: Name of the collection
+            limit: Optional limit on number of documents
+
+        Returns:
+            List of dictionaries containing document data
+        """
+        if not self.is_connected():
+            raise Exception("Firestore not connected")
+
+        try:
+            query = (self.db.collection(collection_name)
+                     .where('is_active', '==', True)
+                     .where('is_archived', '==', False))
+            if limit:
+                query = query.limit(limit)
+
+            docs = query.stream()
+            documents = []
+
+            for doc in docs:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                documents.append(data)
+
+            return documents
+        except Exception as e:
+            raise Exception(f"Error getting active documents: {e}")
+
+    def stream_documents(self, collection_name: str):
+        """
+        Stream documents from a collection one at a time
+
+        Unlike get_all_documents, this yields each document as it arrives from
+        Firestore instead of materializing the full collection in memory.
+
+        Args:
+            collection_name: Name of the collection
+
+        Yields:
+            Dict containing document data
+        """
+        if not self.is_connected():
+            raise Exception("Firestore not connected")
+
+        try:
+            for doc in self.db.collection(collection_name).stream():
+                data = doc.to_dict()
+                data['id'] = doc.id
+                yield data
+        except Exception as e:
+            raise Exception(f"Error streaming documents: {e}")
+
     @retry_on_quota_exceeded(max_retries=3, initial_delay=1)
     def query_documents(self, collection_name: str, field: str, operator: str, value: Any, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -202,7 +266,41 @@ class FirestoreHelper:
             return documents
         except Exception as e:
             raise Exception(f"Error querying documents: {e}")
-    
+
+    def query_documents_multi(self, collection_name: str, filters: List[tuple], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Query documents matching several field conditions at once
+
+        Args:
+            collection_name: Name of the collection
+            filters: List of (field, operator, value) tuples, combined with AND
+            limit: Optional limit on results
+
+        Returns:
+            List of matching documents
+        """
+        if not self.is_connected():
+            raise Exception("Firestore not connected")
+
+        try:
+            query = self.db.collection(collection_name)
+            for field, operator, value in filters:
+                query = query.where(field, operator, value)
+            if limit:
+                query = query.limit(limit)
+
+            docs = query.stream()
+            documents = []
+
+            for doc in docs:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                documents.append(data)
+
+            return documents
+        except Exception as e:
+            raise Exception(f"Error querying documents: {e}")
+
     # UPDATE operations
     def update_document(self, collection_name: str, document_id: str, update_data: Dict[str, Any]) -> bool:
         """
@@ -343,7 +441,7 @@ except ImportError:
 
 
 # Cached convenience functions with quota optimization
-def get_document(collection_name: str, document_id: str, request=None) -> Optional[Dict[str, Any]]:
+def get_document(collection_name: str, document_id: str, request=None, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """
     Get a document from Firestore with intelligent caching
     
@@ -351,12 +449,15 @@ def get_document(collection_name: str, document_id: str, request=None) -> Option
         collection_name: Name of the collection
         document_id: ID of the document
         request: Optional Django request object for request-level caching
+        fields: Optional list of field paths to project server-side;
+            projected reads bypass the caches so a partial document never
+            poisons a full-document entry
     
     Returns:
         Document data or None
     """
-    if not CACHING_ENABLED:
-        return firestore_helper.get_document(collection_name, document_id)
+    if not CACHING_ENABLED or fields:
+        return firestore_helper.get_document(collection_name, document_id, fields)
     
     # Check request cache first
     if request and hasattr(request, '_firestore_cache'):
@@ -453,6 +554,27 @@ def get_all_documents(collection_name: str, limit: Optional[int] = None, request
     return result
 
 
+def get_active_documents(collection_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get active, non-archived documents from a collection
+
+    The filters run server-side in Firestore, so archived documents never
+    cross the network.
+    """
+    return firestore_helper.get_active_documents(collection_name, limit)
+
+
+def stream_documents(collection_name: str):
+    """
+    Stream documents from a collection as a generator
+
+    Results are consumed incrementally, so no caching is applied. Use this
+    for single-pass aggregation over large collections where materializing
+    the whole list would be wasteful.
+    """
+    return firestore_helper.stream_documents(collection_name)
+
+
 def query_documents(collection_name: str, field: str, operator: str, value: Any, limit: Optional[int] = None, request=None) -> List[Dict[str, Any]]:
     """
     Query documents in a collection with caching
@@ -486,6 +608,17 @@ def query_documents(collection_name: str, field: str, operator: str, value: Any,
     return result
 
 
+def query_documents_multi(collection_name: str, filters: List[tuple], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Query documents matching several field conditions at once
+
+    The filters run server-side as chained Firestore where() clauses.
+    Results are not cached: multi-field queries are too dynamic for the
+    app-level cache, matching the policy for query_documents.
+    """
+    return firestore_helper.query_documents_multi(collection_name, filters, limit)
+
+
 def create_document(collection_name: str, document_data: Dict[str, Any], document_id: Optional[str] = None) -> str:
     """Create a document in Firestore and invalidate cache"""
     result = firestore_helper.create_document(collection_name, document_data, document_id)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+One-time migration: convert legacy reports_history created_at timestamps to ISO strings
+
+Newer reports already store created_at as an ISO string at write time, but
+early rows hold Firestore DatetimeWithNanoseconds objects. reports_view no
+longer converts these on every request, so run this script once to normalize
+the remaining legacy rows.
+"""
+import os
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'accreditation.settings')
+django.setup()
+
+from accreditation.firebase_utils import get_all_documents, update_document
+
+print("=" * 80)
+print("MIGRATING reports_history created_at TIMESTAMPS")
+print("=" * 80)
+
+reports = get_all_documents('reports_history')
+print(f"Total reports: {len(reports)}")
+
+migrated = 0
+skipped = 0
+failed = 0
+
+for report in reports:
+    report_id = report.get('id')
+    created_at = report.get('created_at')
+
+    if created_at is None or isinstance(created_at, str):
+        skipped += 1
+        continue
+
+    try:
+        iso_value = created_at.isoformat()
+    except AttributeError:
+        iso_value = str(created_at)
+
+    try:
+        update_document('reports_history', report_id, {'created_at': iso_value})
+        print(f"  Migrated {report_id}: {iso_value}")
+        migrated += 1
+    except Exception as e:
+        print(f"  FAILED {report_id}: {e}")
+        failed += 1
+
+print("\n" + "=" * 80)
+print(f"Done. Migrated: {migrated} | Already strings: {skipped} | Failed: {failed}")
+print("=" * 80)